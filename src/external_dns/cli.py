@@ -61,8 +61,11 @@ Configuration:
     Runtime Environment Variables:
         SYNC_MODE              "once" or "watch" (polling loop) (default: watch)
         POLL_INTERVAL_SECONDS  Poll interval in watch mode (default: 60)
+        RESYNC_INTERVAL_SECONDS  Max seconds between full reconciles (default: 300)
         LOG_LEVEL              DEBUG, INFO, WARNING, ERROR (default: INFO)
         STATE_PATH             JSON state file path (default: /data/state.json)
+        STATE_PRETTY           Write the state file indented for reading (default: false)
+        STATE_FSYNC            fsync state writes for crash safety (default: true)
 
     Static rewrites:
         EXTERNAL_DNS_STATIC_REWRITES  Comma-separated "domain" or "domain=answer" entries.
@@ -100,24 +103,82 @@ Configuration:
 from __future__ import annotations
 
 import fnmatch
+import hashlib
 import json
 import logging
 import os
 import re
 import signal
+import stat
 import sys
 import threading
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypedDict,
+    TypeVar,
+)
 
 import requests
-import yaml
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
+# Optional faster JSON codec (pip install external-dns[fast]); json.loads also accepts bytes
+try:
+    from orjson import OPT_INDENT_2, OPT_SORT_KEYS
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson_dumps = None
+    _json_loads = json.loads
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode sets as sorted lists so serialized output is deterministic."""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps_sorted(obj: Any, *, pretty: bool = False) -> bytes:
+    """Serialize obj as key-sorted UTF-8 JSON, compact unless pretty (2-space indent)."""
+    if _orjson_dumps is not None:
+        option = OPT_SORT_KEYS | OPT_INDENT_2 if pretty else OPT_SORT_KEYS
+        return _orjson_dumps(obj, default=_json_default, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, sort_keys=True, default=_json_default).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), sort_keys=True, default=_json_default).encode(
+        "utf-8"
+    )
+
+
+@lru_cache(maxsize=None)
+def _yaml_loader() -> Callable[[Any], Any]:
+    """Return a safe YAML load function, importing PyYAML on first use.
+
+    Deployments configured purely through environment variables never touch
+    YAML, so the import is deferred until a config file is actually parsed.
+    """
+    import yaml
+
+    # Prefer the libyaml-backed C loader when available (same safety as SafeLoader)
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return lambda stream: yaml.load(stream, Loader=loader)
+
+
 T = TypeVar("T")
 
 # =============================================================================
@@ -133,6 +194,7 @@ def retry_with_backoff(
     max_delay: float = 30.0,
     exponential_base: float = 2.0,
     retryable_exceptions: tuple = (requests.exceptions.RequestException,),
+    should_retry: Optional[Callable[[Exception], bool]] = None,
 ) -> T:
     """Retry a function with exponential backoff.
 
@@ -143,6 +205,9 @@ def retry_with_backoff(
         max_delay: Maximum delay cap in seconds
         exponential_base: Base for exponential backoff calculation
         retryable_exceptions: Tuple of exception types that trigger retry
+        should_retry: Optional predicate applied to a caught retryable exception;
+            returning False re-raises it immediately. Defaults to
+            is_transient_error.
 
     Returns:
         Result of successful function call
@@ -150,33 +215,77 @@ def retry_with_backoff(
     Raises:
         Last exception if all retries exhausted
     """
+    if max_retries <= 0:
+        return func()
+
+    if should_retry is None:
+        should_retry = is_transient_error
+
     last_exception: Optional[Exception] = None
+    delay = min(base_delay, max_delay)
 
     for attempt in range(max_retries + 1):
         try:
             return func()
         except retryable_exceptions as e:
+            if not should_retry(e):
+                raise
             last_exception = e
             if attempt == max_retries:
                 break
-            delay = min(base_delay * (exponential_base**attempt), max_delay)
             logger.debug(f"Retry {attempt + 1}/{max_retries} after {delay:.1f}s: {e}")
-            time.sleep(delay)
+            # Interruptible sleep - stop retrying as soon as shutdown is requested
+            if _shutdown_event.wait(delay):
+                break
+            delay = min(delay * exponential_base, max_delay)
 
     raise last_exception  # type: ignore[misc]
 
 
+def is_transient_error(exc: Exception) -> bool:
+    """Return False for HTTP client errors that retrying cannot fix.
+
+    4xx responses (bad credentials, missing endpoint) fail fast; 429 and 5xx
+    responses, connection errors and timeouts remain retryable.
+    """
+    if isinstance(exc, requests.exceptions.HTTPError):
+        response = exc.response
+        if response is not None:
+            status = response.status_code
+            return status >= 500 or status == 429
+    return True
+
+
 # =============================================================================
-# File Watching Utilities
+# HTTP Utilities
 # =============================================================================
 
 
-def get_config_file_mtime(config_path: str) -> float:
-    """Get modification time of config file, returns 0 if file doesn't exist."""
-    try:
-        return os.path.getmtime(config_path) if os.path.exists(config_path) else 0.0
-    except (OSError, IOError):
-        return 0.0
+def create_http_session(pool_maxsize: int = 10, pool_connections: int = 4) -> requests.Session:
+    """Create a requests session with a keep-alive connection pool.
+
+    Args:
+        pool_maxsize: Connections kept open per host; size to the number of
+            concurrent requests made through the session
+        pool_connections: Number of per-host pools to keep; size to the number
+            of distinct hosts contacted through the session
+
+    Returns:
+        Session with an HTTPAdapter mounted for http:// and https://
+    """
+    session = requests.Session()
+    # urllib3-level retries are disabled; retry_with_backoff owns retry policy
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# =============================================================================
+# File Watching Utilities
+# =============================================================================
 
 
 def find_config_files(config_path: str) -> List[str]:
@@ -189,27 +298,82 @@ def find_config_files(config_path: str) -> List[str]:
         List of config file paths (excluding .template files)
     """
     path = Path(config_path)
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        # Path doesn't exist yet
+        return []
 
     # If it's a file, return it directly
-    if path.is_file():
+    if stat.S_ISREG(mode):
         return [str(path)]
 
-    # If it's a directory, scan for .yaml files
-    if path.is_dir():
-        yaml_files = sorted(path.glob("*.yaml"))
-        # Exclude .template files
-        return [str(f) for f in yaml_files if not f.name.endswith(".template")]
+    # If it's a directory, scan for .yaml files (excluding .template files)
+    if stat.S_ISDIR(mode):
+        with os.scandir(path) as it:
+            yaml_files = [
+                entry.path
+                for entry in it
+                if entry.name.endswith(".yaml")
+                and not entry.name.endswith(".template")
+                and entry.is_file()
+            ]
+        yaml_files.sort()
+        return yaml_files
 
-    # Path doesn't exist yet
     return []
 
 
-def get_config_files_mtimes(config_files: List[str]) -> Dict[str, float]:
-    """Get modification times for all config files."""
-    return {f: get_config_file_mtime(f) for f in config_files}
+def snapshot_config_files(config_path: str) -> Dict[str, Tuple[int, int]]:
+    """Map each config file under config_path to its (mtime_ns, size) signature.
+
+    Used by the watch loop to detect added, removed or modified config files by
+    comparing two snapshots; files that vanish between listing and stat are left out.
+    """
+    snapshot: Dict[str, Tuple[int, int]] = {}
+    for config_file in find_config_files(config_path):
+        try:
+            st = os.stat(config_file)
+        except OSError:
+            continue
+        snapshot[config_file] = (st.st_mtime_ns, st.st_size)
+    return snapshot
+
+
+# Parsed YAML documents keyed by path, tagged with the (mtime_ns, size) they were parsed at
+_yaml_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_YAML_CACHE_MAX_ENTRIES = 1000
+
+
+def _load_yaml_cached(path: str) -> Any:
+    """Parse a YAML file, reusing the previous result while its mtime and size are unchanged.
+
+    The returned object is shared between callers and must be treated as read-only.
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file cannot be parsed
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _yaml_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    try:
+        # Hand libyaml the whole file as bytes: one read, encoding detected and decoded in C
+        data = _yaml_loader()(Path(path).read_bytes())
+    except Exception:
+        _yaml_cache.pop(path, None)
+        raise
+
+    if path not in _yaml_cache and len(_yaml_cache) >= _YAML_CACHE_MAX_ENTRIES:
+        _yaml_cache.clear()
+    _yaml_cache[path] = (key, data)
+    return data
 
 
-@dataclass
+@dataclass(slots=True)
 class DNSProviderConfig:
     """Configuration for a DNS provider."""
 
@@ -242,8 +406,7 @@ def load_dns_providers_from_yaml(config_path: str) -> List[DNSProviderConfig]:
 
     for config_file in config_files:
         try:
-            with open(config_file, "r") as f:
-                config_data = yaml.safe_load(f)
+            config_data = _load_yaml_cached(config_file)
 
             if not config_data:
                 continue
@@ -255,9 +418,11 @@ def load_dns_providers_from_yaml(config_path: str) -> List[DNSProviderConfig]:
                     for item in providers_list:
                         if not isinstance(item, dict):
                             continue
-                        provider_type = str(item.get("provider") or "adguard").strip().lower()
-                        name = str(item.get("name") or provider_type).strip()
-                        url = str(item.get("url") or "").strip()
+                        provider_type = sys.intern(
+                            _str_value(item.get("provider"), "adguard").lower()
+                        )
+                        name = sys.intern(_str_value(item.get("name"), provider_type))
+                        url = sys.intern(_str_value(item.get("url")))
                         if not url:
                             continue
                         providers.append(
@@ -265,9 +430,9 @@ def load_dns_providers_from_yaml(config_path: str) -> List[DNSProviderConfig]:
                                 name=name,
                                 provider=provider_type,
                                 url=url,
-                                username=str(item.get("username") or "").strip(),
-                                password=str(item.get("password") or "").strip(),
-                                api_token=str(item.get("api_token") or "").strip(),
+                                username=_str_value(item.get("username")),
+                                password=_str_value(item.get("password")),
+                                api_token=_str_value(item.get("api_token")),
                             )
                         )
 
@@ -275,15 +440,15 @@ def load_dns_providers_from_yaml(config_path: str) -> List[DNSProviderConfig]:
             elif "dns_provider" in config_data:
                 dns_config = config_data["dns_provider"]
                 if isinstance(dns_config, dict):
-                    url = str(dns_config.get("url") or "").strip()
+                    url = sys.intern(_str_value(dns_config.get("url")))
                     if url:
                         providers.append(
                             DNSProviderConfig(
                                 name="default",
                                 provider="adguard",
                                 url=url,
-                                username=str(dns_config.get("username") or "").strip(),
-                                password=str(dns_config.get("password") or "").strip(),
+                                username=_str_value(dns_config.get("username")),
+                                password=_str_value(dns_config.get("password")),
                             )
                         )
 
@@ -318,22 +483,26 @@ def load_dns_config_from_yaml(config_path: str) -> Optional[Dict[str, str]]:
     }
 
 
-@dataclass
+@dataclass(slots=True)
 class RuntimeSettings:
     """Runtime configuration settings."""
 
     sync_mode: str = "watch"
     poll_interval: int = 60
+    resync_interval: int = 300
     log_level: str = "INFO"
     default_zone: str = "internal"
     exclude_domains: List[str] = None  # type: ignore
     static_rewrites: Dict[str, str] = None  # type: ignore
+    exclude_patterns: List[re.Pattern] = None  # type: ignore  # compiled exclude_domains
 
     def __post_init__(self):
         if self.exclude_domains is None:
             self.exclude_domains = []
         if self.static_rewrites is None:
             self.static_rewrites = {}
+        if self.exclude_patterns is None:
+            self.exclude_patterns = []
 
 
 def load_settings_from_yaml(config_path: str) -> RuntimeSettings:
@@ -353,8 +522,7 @@ def load_settings_from_yaml(config_path: str) -> RuntimeSettings:
     # Load from YAML first
     for config_file in config_files:
         try:
-            with open(config_file, "r") as f:
-                config_data = yaml.safe_load(f)
+            config_data = _load_yaml_cached(config_file)
 
             if not config_data:
                 continue
@@ -366,6 +534,8 @@ def load_settings_from_yaml(config_path: str) -> RuntimeSettings:
                     settings.sync_mode = str(s["sync_mode"]).strip().lower()
                 if "poll_interval" in s:
                     settings.poll_interval = int(s["poll_interval"])
+                if "resync_interval" in s:
+                    settings.resync_interval = int(s["resync_interval"])
                 if "log_level" in s:
                     settings.log_level = str(s["log_level"]).strip().upper()
                 if "default_zone" in s:
@@ -375,14 +545,16 @@ def load_settings_from_yaml(config_path: str) -> RuntimeSettings:
             if "exclude_domains" in config_data:
                 excludes = config_data["exclude_domains"]
                 if isinstance(excludes, list):
-                    settings.exclude_domains = [str(e).strip() for e in excludes if e]
+                    settings.exclude_domains = [sys.intern(str(e).strip()) for e in excludes if e]
 
             # Load static_rewrites dict
             if "static_rewrites" in config_data:
                 rewrites = config_data["static_rewrites"]
                 if isinstance(rewrites, dict):
                     settings.static_rewrites = {
-                        str(k).strip(): str(v).strip() for k, v in rewrites.items() if k
+                        sys.intern(str(k).strip()): sys.intern(str(v).strip())
+                        for k, v in rewrites.items()
+                        if k
                     }
 
         except Exception:
@@ -390,36 +562,40 @@ def load_settings_from_yaml(config_path: str) -> RuntimeSettings:
             pass  # Will use defaults
 
     # Env vars override YAML values
-    if os.getenv("SYNC_MODE"):
-        settings.sync_mode = os.getenv("SYNC_MODE", "watch").strip().lower()
-    if os.getenv("POLL_INTERVAL_SECONDS"):
-        settings.poll_interval = int(os.getenv("POLL_INTERVAL_SECONDS", "60"))
-    if os.getenv("LOG_LEVEL"):
-        settings.log_level = os.getenv("LOG_LEVEL", "INFO").strip().upper()
-    if os.getenv("EXTERNAL_DNS_DEFAULT_ZONE"):
-        settings.default_zone = os.getenv("EXTERNAL_DNS_DEFAULT_ZONE", "internal").strip().lower()
+    env = os.environ
+    sync_mode = env.get("SYNC_MODE")
+    if sync_mode:
+        settings.sync_mode = sync_mode.strip().lower()
+    poll_interval = env.get("POLL_INTERVAL_SECONDS")
+    if poll_interval:
+        settings.poll_interval = int(poll_interval)
+    resync_interval = env.get("RESYNC_INTERVAL_SECONDS")
+    if resync_interval:
+        settings.resync_interval = int(resync_interval)
+    log_level = env.get("LOG_LEVEL")
+    if log_level:
+        settings.log_level = log_level.strip().upper()
+    default_zone = env.get("EXTERNAL_DNS_DEFAULT_ZONE")
+    if default_zone:
+        settings.default_zone = default_zone.strip().lower()
 
     # Merge exclude domains from env var (append to YAML list)
-    env_excludes = os.getenv("EXTERNAL_DNS_EXCLUDE_DOMAINS", "").strip()
-    if env_excludes:
-        for item in env_excludes.split(","):
-            item = item.strip()
-            if item and item not in settings.exclude_domains:
-                settings.exclude_domains.append(item)
+    env_excludes = env.get("EXTERNAL_DNS_EXCLUDE_DOMAINS", "")
+    for item in filter(None, (part.strip() for part in env_excludes.split(","))):
+        if item not in settings.exclude_domains:
+            settings.exclude_domains.append(sys.intern(item))
 
     # Merge static rewrites from env var (override YAML values)
-    env_rewrites = os.getenv("EXTERNAL_DNS_STATIC_REWRITES", "").strip()
-    if env_rewrites:
-        for item in env_rewrites.split(","):
-            item = item.strip()
-            if not item:
-                continue
-            if "=" in item:
-                domain, answer = item.split("=", 1)
-                settings.static_rewrites[domain.strip()] = answer.strip()
-            else:
-                # Will use first instance target_ip as default (handled later)
-                settings.static_rewrites[item] = ""
+    env_rewrites = env.get("EXTERNAL_DNS_STATIC_REWRITES", "")
+    for item in filter(None, (part.strip() for part in env_rewrites.split(","))):
+        domain, sep, answer = item.partition("=")
+        # Entries without an answer use the first instance target_ip (handled later)
+        settings.static_rewrites[sys.intern(domain.strip())] = (
+            sys.intern(answer.strip()) if sep else ""
+        )
+
+    # Compile exclusions once so matching never re-parses the raw strings
+    settings.exclude_patterns = _parse_exclude_patterns(settings.exclude_domains)
 
     return settings
 
@@ -428,6 +604,17 @@ def load_settings_from_yaml(config_path: str) -> RuntimeSettings:
 # Configuration
 # =============================================================================
 
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "y", "on"})
+
+
+def _parse_bool(value: Any, *, default: bool = True) -> bool:
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in _TRUE_STRINGS
+
+
 # Provider selection
 DNS_PROVIDER = os.getenv("DNS_PROVIDER", "adguard").lower().strip()
 PROXY_PROVIDER = os.getenv("PROXY_PROVIDER", "traefik").lower().strip()
@@ -437,21 +624,18 @@ ADGUARD_URL = os.getenv("ADGUARD_URL", "")
 ADGUARD_USERNAME = os.getenv("ADGUARD_USERNAME", "")
 ADGUARD_PASSWORD = os.getenv("ADGUARD_PASSWORD", "")
 
-# Config file path (supports CONFIG_PATH for backwards compatibility)
-CONFIG_PATH = os.getenv("CONFIG_PATH", os.getenv("CONFIG_PATH", "/config/config.yaml"))
+# Config file path (file or directory of *.yaml files)
+CONFIG_PATH = os.getenv("CONFIG_PATH", "/config/config.yaml")
 TRAEFIK_INSTANCES = os.getenv("TRAEFIK_INSTANCES", "").strip()
 TRAEFIK_URL = os.getenv("TRAEFIK_URL", "http://traefik:8080")
 TRAEFIK_TARGET_IP = os.getenv("TRAEFIK_TARGET_IP", os.getenv("INTERNAL_IP", ""))
 
-# Runtime configuration
-SYNC_MODE = os.getenv("SYNC_MODE", "watch")
-POLL_INTERVAL_SECONDS = int(os.getenv("POLL_INTERVAL_SECONDS", "60"))
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+# Runtime configuration (sync mode, poll interval, log level, static rewrites and
+# exclusions are read by load_settings_from_yaml so YAML and env can be merged)
 STATE_PATH = os.getenv("STATE_PATH", "/data/state.json")
-
-# Static rewrites and exclusions
-EXTERNAL_DNS_STATIC_REWRITES = os.getenv("EXTERNAL_DNS_STATIC_REWRITES", "")
-EXTERNAL_DNS_EXCLUDE_DOMAINS = os.getenv("EXTERNAL_DNS_EXCLUDE_DOMAINS", "")
+STATE_PRETTY = _parse_bool(os.getenv("STATE_PRETTY"), default=False)
+# An empty STATE_FSYNC is treated as unset, keeping fsync on
+STATE_FSYNC = _parse_bool(os.getenv("STATE_FSYNC") or None, default=True)
 
 # Zone configuration
 EXTERNAL_DNS_DEFAULT_ZONE = os.getenv("EXTERNAL_DNS_DEFAULT_ZONE", "internal").lower().strip()
@@ -461,13 +645,20 @@ EXTERNAL_DNS_ZONE_LABEL = os.getenv("EXTERNAL_DNS_ZONE_LABEL", "external-dns.zon
 # Logging Setup
 # =============================================================================
 
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL.upper(), logging.INFO),
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
 logger = logging.getLogger(__name__)
 
+
+def _configure_logging(log_level: str) -> None:
+    """Configure root logging for the CLI (importing the module leaves logging alone)."""
+    level = getattr(logging, log_level.strip().upper(), logging.INFO)
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    logging.getLogger().setLevel(level)
+
+
 # Shutdown event for graceful termination
 _shutdown_event = threading.Event()
 
@@ -504,7 +695,7 @@ class DNSZone(Enum):
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DNSRecord:
     """Represents a DNS record."""
 
@@ -512,7 +703,7 @@ class DNSRecord:
     answer: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProxyRoute:
     """Represents a route discovered from a reverse proxy."""
 
@@ -523,7 +714,7 @@ class ProxyRoute:
     router_name: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProxyInstance:
     """Configuration for a reverse proxy instance."""
 
@@ -538,6 +729,22 @@ class ProxyInstance:
     middleware_filter: str = ""
 
 
+@dataclass(slots=True)
+class SyncPlan:
+    """DNS record changes computed by one sync cycle, applied deletes-first."""
+
+    deletes: List[Tuple[str, str]] = field(default_factory=list)
+    adds: List[Tuple[str, str]] = field(default_factory=list)
+
+
+class TraefikRouter(TypedDict, total=False):
+    """Subset of a Traefik /api/http/routers entry read by the provider."""
+
+    name: str
+    rule: str
+    middlewares: List[str]
+
+
 # =============================================================================
 # DNS Provider Interface and Implementations
 # =============================================================================
@@ -578,14 +785,23 @@ class DNSProvider(ABC):
             return self.add_record(domain, new_answer)
         return False
 
+    def add_records(self, records: List[Tuple[str, str]]) -> Dict[Tuple[str, str], bool]:
+        """Add multiple DNS records. Default implementation: add_record for each."""
+        return {(domain, answer): self.add_record(domain, answer) for domain, answer in records}
+
+    def delete_records(self, records: List[Tuple[str, str]]) -> Dict[Tuple[str, str], bool]:
+        """Delete multiple DNS records. Default implementation: delete_record for each."""
+        return {(domain, answer): self.delete_record(domain, answer) for domain, answer in records}
+
 
 class AdGuardDNSProvider(DNSProvider):
     """AdGuard Home DNS provider implementation."""
 
-    def __init__(self, url: str, username: str, password: str):
+    def __init__(self, url: str, username: str, password: str, max_workers: int = 8):
         self._url = url.rstrip("/")
         self._auth = HTTPBasicAuth(username, password) if username and password else None
-        self._session = requests.Session()
+        self._max_workers = max(1, max_workers)
+        self._session = create_http_session(pool_maxsize=self._max_workers)
         if self._auth:
             self._session.auth = self._auth
 
@@ -614,11 +830,11 @@ class AdGuardDNSProvider(DNSProvider):
         def _do_request() -> Any:
             response = self._session.get(f"{self._url}/control/rewrite/list", timeout=5)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
 
         try:
             data = retry_with_backoff(_do_request, max_retries=2, base_delay=1.0)
-        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             status_info = ""
             if hasattr(e, "response") and e.response is not None:
                 status_info = f" (HTTP {e.response.status_code})"
@@ -632,7 +848,7 @@ class AdGuardDNSProvider(DNSProvider):
             if not isinstance(domain, str) or not isinstance(answer, str):
                 logger.warning(f"Skipping malformed record: {r}")
                 continue
-            records.append(DNSRecord(domain=domain, answer=answer))
+            records.append(DNSRecord(domain=sys.intern(domain), answer=sys.intern(answer)))
         return records
 
     def add_record(self, domain: str, answer: str) -> bool:
@@ -673,6 +889,24 @@ class AdGuardDNSProvider(DNSProvider):
             logger.error(f"Failed to delete record for {domain} at {self._url}{status_info}: {e}")
             return False
 
+    def add_records(self, records: List[Tuple[str, str]]) -> Dict[Tuple[str, str], bool]:
+        return self._run_concurrently(self.add_record, records)
+
+    def delete_records(self, records: List[Tuple[str, str]]) -> Dict[Tuple[str, str], bool]:
+        return self._run_concurrently(self.delete_record, records)
+
+    def _run_concurrently(
+        self, func: Callable[[str, str], bool], records: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], bool]:
+        """Apply a single-record operation to many records over the pooled session."""
+        unique = list(dict.fromkeys(records))
+        if len(unique) <= 1:
+            return {record: func(*record) for record in unique}
+
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(unique))) as executor:
+            futures = {record: executor.submit(func, *record) for record in unique}
+        return {record: future.result() for record, future in futures.items()}
+
 
 # =============================================================================
 # Reverse Proxy Provider Interface and Implementations
@@ -699,11 +933,60 @@ class ReverseProxyProvider(ABC):
         pass
 
 
+@lru_cache(maxsize=128)
+def _compile_wildcard(pattern: str) -> re.Pattern:
+    """Compile a shell-style wildcard (fnmatch syntax) to a cached regex."""
+    return re.compile(fnmatch.translate(pattern))
+
+
+_WILDCARD_CHARS = frozenset("*?[")
+
+
+@lru_cache(maxsize=128)
+def _wildcard_matcher(pattern: str) -> Callable[[str], bool]:
+    """Return a predicate for a wildcard, using str methods for the common shapes.
+
+    Exact names, "prefix*" and "*suffix" patterns are answered with ==,
+    str.startswith and str.endswith; anything else uses the compiled fnmatch regex.
+    """
+    head, tail = pattern[:1], pattern[-1:]
+    if _WILDCARD_CHARS.isdisjoint(pattern):
+        return lambda name: name == pattern
+    if head == "*" and _WILDCARD_CHARS.isdisjoint(pattern[1:]):
+        suffix = pattern[1:]
+        return lambda name: name.endswith(suffix)
+    if tail == "*" and _WILDCARD_CHARS.isdisjoint(pattern[:-1]):
+        prefix = pattern[:-1]
+        return lambda name: name.startswith(prefix)
+    regex = _compile_wildcard(pattern)
+    return lambda name: regex.match(name) is not None
+
+
+_HOST_RULE_RE = re.compile(r"Host\([`\"\']([^`\"\']+)[`\"\']\)")
+
+
+def _hostnames_in_rule(rule: str) -> Tuple[str, ...]:
+    """Return the de-duplicated Host() hostnames in a Traefik rule, in rule order."""
+    # Cheap substring check skips the regex and the cache for PathPrefix/Header-only rules
+    if not rule or "Host(" not in rule:
+        return ()
+    return _parse_host_rule(rule)
+
+
+@lru_cache(maxsize=10000)
+def _parse_host_rule(rule: str) -> Tuple[str, ...]:
+    """Parse Host() matchers from a rule; memoized since rules repeat every cycle."""
+    found = _HOST_RULE_RE.findall(rule)
+    if len(found) < 2:
+        return tuple(found)
+    # Order-preserving dedupe; sync_once orders domains itself
+    return tuple(dict.fromkeys(found))
+
+
 class TraefikProxyProvider(ReverseProxyProvider):
     """Traefik reverse proxy provider implementation."""
 
-    HOST_RULE_RE = re.compile(r"Host\([`\"\']([^`\"\']+)[`\"\']\)")
-    ZONE_SUFFIX_RE = re.compile(r"-(internal|external)(?:@|$)", re.IGNORECASE)
+    HOST_RULE_RE = _HOST_RULE_RE
 
     def __init__(
         self,
@@ -722,57 +1005,63 @@ class TraefikProxyProvider(ReverseProxyProvider):
         self._timeout = timeout_seconds
         self._default_zone = DNSZone.INTERNAL if default_zone != "external" else DNSZone.EXTERNAL
         self._zone_label = zone_label
+        # Shared across instances and cycles so TCP/TLS connections are reused;
+        # credentials and TLS verification are passed per request
+        self._session = create_http_session(pool_maxsize=2, pool_connections=16)
+        # Instances built from each config file, tagged with the parsed document they
+        # came from; _load_yaml_cached returns the same object while the file is unchanged
+        self._file_instances: Dict[str, Tuple[Any, Tuple[ProxyInstance, ...]]] = {}
+        # Last routes per instance name with the instance, ETag and body digest they
+        # came from, so an unchanged router list is neither parsed nor re-walked
+        self._route_cache: Dict[
+            str, Tuple[ProxyInstance, Optional[str], bytes, Tuple[ProxyRoute, ...]]
+        ] = {}
 
     @property
     def name(self) -> str:
         return "Traefik"
 
     def get_instances(self) -> List[ProxyInstance]:
+        instances = self._load_instances()
+        # Drop cached routes for instances removed or renamed since the last load
+        route_cache = self._route_cache
+        if route_cache:
+            for stale in route_cache.keys() - {instance.name for instance in instances}:
+                del route_cache[stale]
+        return instances
+
+    def _load_instances(self) -> List[ProxyInstance]:
         # Try loading from YAML config file(s) first
         if self._config_path:
             config_files = find_config_files(self._config_path)
             if config_files:
                 all_instances: List[ProxyInstance] = []
+                file_instances = self._file_instances
+                for stale in file_instances.keys() - set(config_files):
+                    del file_instances[stale]
 
                 for config_file in config_files:
                     try:
-                        with open(config_file, "r") as f:
-                            config_data = yaml.safe_load(f)
+                        config_data = _load_yaml_cached(config_file)
+
+                        cached = file_instances.get(config_file)
+                        if cached is not None and cached[0] is config_data:
+                            all_instances.extend(cached[1])
+                            continue
 
                         if not config_data or "sources" not in config_data:
                             logger.warning(f"Config file {config_file} missing 'sources' key")
                             continue
 
-                        for item in config_data["sources"]:
-                            if not isinstance(item, dict):
-                                continue
-                            name = str(item.get("name") or "traefik").strip()
-                            url = str(item.get("url") or "").strip()
-                            target_ip = str(
-                                item.get("target_ip") or item.get("internal_ip") or ""
-                            ).strip()
-                            if not url or not target_ip:
-                                continue
-                            instance_type = str(item.get("type") or "traefik").strip()
-                            verify_tls = _parse_bool(item.get("verify_tls"), default=True)
-                            username = str(item.get("username") or "").strip()
-                            password = str(item.get("password") or "").strip()
-                            router_filter = str(item.get("router_filter") or "").strip()
-                            middleware_filter = str(item.get("middleware_filter") or "").strip()
-                            all_instances.append(
-                                ProxyInstance(
-                                    name=name,
-                                    url=url,
-                                    target_ip=target_ip,
-                                    type=instance_type,
-                                    verify_tls=verify_tls,
-                                    username=username,
-                                    password=password,
-                                    router_filter=router_filter,
-                                    middleware_filter=middleware_filter,
-                                )
-                            )
+                        built = tuple(
+                            instance
+                            for instance in map(self._instance_from_dict, config_data["sources"])
+                            if instance is not None
+                        )
+                        file_instances[config_file] = (config_data, built)
+                        all_instances.extend(built)
                     except Exception as e:
+                        file_instances.pop(config_file, None)
                         logger.error(f"Failed to load config from {config_file}: {e}")
 
                 if all_instances:
@@ -784,38 +1073,15 @@ class TraefikProxyProvider(ReverseProxyProvider):
         # Fall back to JSON from environment variable
         if self._instances_json:
             try:
-                raw = json.loads(self._instances_json)
+                raw = _json_loads(self._instances_json)
                 if not isinstance(raw, list):
                     raise ValueError("TRAEFIK_INSTANCES must be a JSON list")
 
                 instances: List[ProxyInstance] = []
                 for item in raw:
-                    if not isinstance(item, dict):
-                        continue
-                    name = str(item.get("name") or "traefik").strip()
-                    url = str(item.get("url") or "").strip()
-                    target_ip = str(item.get("target_ip") or item.get("internal_ip") or "").strip()
-                    if not url or not target_ip:
-                        continue
-                    instance_type = str(item.get("type") or "traefik").strip()
-                    verify_tls = _parse_bool(item.get("verify_tls"), default=True)
-                    username = str(item.get("username") or "").strip()
-                    password = str(item.get("password") or "").strip()
-                    router_filter = str(item.get("router_filter") or "").strip()
-                    middleware_filter = str(item.get("middleware_filter") or "").strip()
-                    instances.append(
-                        ProxyInstance(
-                            name=name,
-                            url=url,
-                            target_ip=target_ip,
-                            type=instance_type,
-                            verify_tls=verify_tls,
-                            username=username,
-                            password=password,
-                            router_filter=router_filter,
-                            middleware_filter=middleware_filter,
-                        )
-                    )
+                    instance = self._instance_from_dict(item)
+                    if instance is not None:
+                        instances.append(instance)
                 return instances
             except Exception as e:
                 logger.error(f"Failed to parse TRAEFIK_INSTANCES JSON: {e}")
@@ -828,25 +1094,74 @@ class TraefikProxyProvider(ReverseProxyProvider):
             return []
         return [ProxyInstance(name="traefik", url=url, target_ip=target_ip)]
 
+    @staticmethod
+    def _instance_from_dict(item: Any) -> Optional[ProxyInstance]:
+        """Build a ProxyInstance from a config/JSON source entry.
+
+        Returns None for non-dict entries and entries missing url or target_ip.
+        """
+        if not isinstance(item, dict):
+            return None
+        get = item.get
+        url = _str_value(get("url"))
+        target_ip = _str_value(get("target_ip") or get("internal_ip"))
+        if not url or not target_ip:
+            return None
+        return ProxyInstance(
+            name=_str_value(get("name"), "traefik"),
+            url=url,
+            target_ip=target_ip,
+            type=_str_value(get("type"), "traefik"),
+            verify_tls=_parse_bool(get("verify_tls"), default=True),
+            username=_str_value(get("username")),
+            password=_str_value(get("password")),
+            router_filter=_str_value(get("router_filter")),
+            middleware_filter=_str_value(get("middleware_filter")),
+        )
+
     def get_routes(self, instance: ProxyInstance) -> List[ProxyRoute]:
-        session = requests.Session()
+        auth = None
         if instance.username and instance.password:
-            session.auth = HTTPBasicAuth(instance.username, instance.password)
+            auth = HTTPBasicAuth(instance.username, instance.password)
 
         base = instance.url.rstrip("/")
 
-        def _do_request() -> Any:
-            response = session.get(
+        # Reuse the last poll's routes when Traefik reports (304) or returns an unchanged body
+        cached = self._route_cache.get(instance.name)
+        if cached is not None and cached[0] != instance:
+            cached = None
+        headers = {"If-None-Match": cached[1]} if cached is not None and cached[1] else None
+
+        def _do_request() -> requests.Response:
+            response = self._session.get(
                 f"{base}/api/http/routers",
+                auth=auth,
                 timeout=self._timeout,
                 verify=instance.verify_tls,
+                headers=headers,
             )
             response.raise_for_status()
-            return response.json()
+            return response
 
         try:
-            routers = retry_with_backoff(_do_request, max_retries=2, base_delay=1.0)
-        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+            response = retry_with_backoff(_do_request, max_retries=2, base_delay=1.0)
+            if cached is not None and response.status_code == 304:
+                return list(cached[3])
+            body = response.content
+            digest = (
+                hashlib.blake2b(body, digest_size=16).digest() if isinstance(body, bytes) else None
+            )
+            if cached is not None and digest is not None and digest == cached[2]:
+                return list(cached[3])
+            try:
+                routers: List[TraefikRouter] = _json_loads(body)
+            except ValueError as e:
+                # Surface a bad body as a RequestException, as response.json() did, so
+                # sync_once marks only this instance as failed
+                raise requests.exceptions.InvalidJSONError(
+                    f"Invalid JSON from {instance.name}: {e}"
+                ) from e
+        except requests.exceptions.RequestException as e:
             logger.error(f"Failed to get routes from {instance.name}: {e}")
             raise
 
@@ -858,47 +1173,74 @@ class TraefikProxyProvider(ReverseProxyProvider):
             )
             return []
 
+        # Resolve filters once per call rather than once per router
+        router_match = _wildcard_matcher(instance.router_filter) if instance.router_filter else None
+        middleware_lower = instance.middleware_filter.lower()
+
+        # Bind per-call invariants and hot callables to locals for the router loop
+        intern = sys.intern
+        source_name = intern(instance.name)
+        target_ip = intern(instance.target_ip)
+        detect_zone = self._detect_zone
+        extract_hostnames = _hostnames_in_rule
+        uses_middleware = self._uses_middleware
+        debug = logger.isEnabledFor(logging.DEBUG)
+
         routes: List[ProxyRoute] = []
+        append = routes.append
         for router in routers:
             if not isinstance(router, dict):
-                logger.debug(f"Skipping non-dict router entry: {router}")
+                if debug:
+                    logger.debug(f"Skipping non-dict router entry: {router}")
                 continue
             router_name = router.get("name") or ""
 
             # Apply router name filter if specified
-            if instance.router_filter and not self._matches_filter(
-                router_name, instance.router_filter
-            ):
-                logger.debug(
-                    f"Router '{router_name}' filtered out by name pattern '{instance.router_filter}'"
-                )
+            if router_match is not None and not router_match(router_name):
+                if debug:
+                    logger.debug(
+                        f"Router '{router_name}' filtered out by name pattern "
+                        f"'{instance.router_filter}'"
+                    )
                 continue
 
             # Apply middleware filter if specified
-            if instance.middleware_filter and not self._has_middleware(
-                router, instance.middleware_filter
-            ):
-                logger.debug(
-                    f"Router '{router_name}' filtered out by middleware '{instance.middleware_filter}'"
-                )
+            if middleware_lower and not uses_middleware(router, middleware_lower):
+                if debug:
+                    logger.debug(
+                        f"Router '{router_name}' filtered out by middleware "
+                        f"'{instance.middleware_filter}'"
+                    )
                 continue
 
-            rule = router.get("rule") or ""
-            zone = self._detect_zone(router_name, router)
+            hostnames = extract_hostnames(router.get("rule") or "")
+            if not hostnames:
+                continue
+            zone = detect_zone(router_name, router)
+            router_name = intern(router_name)
 
-            for hostname in self._extract_hostnames(rule):
-                routes.append(
+            for hostname in hostnames:
+                append(
                     ProxyRoute(
-                        hostname=hostname,
-                        source_name=instance.name,
-                        target_ip=instance.target_ip,
+                        hostname=intern(hostname),
+                        source_name=source_name,
+                        target_ip=target_ip,
                         zone=zone,
                         router_name=router_name,
                     )
                 )
+
+        if digest is not None:
+            etag = response.headers.get("ETag")
+            self._route_cache[instance.name] = (
+                instance,
+                etag if isinstance(etag, str) else None,
+                digest,
+                tuple(routes),
+            )
         return routes
 
-    def _detect_zone(self, router_name: str, router: Dict[str, Any]) -> DNSZone:
+    def _detect_zone(self, router_name: str, router: TraefikRouter) -> DNSZone:
         """Detect DNS zone from router name suffix or labels.
 
         Priority:
@@ -906,12 +1248,14 @@ class TraefikProxyProvider(ReverseProxyProvider):
           2. Custom label (e.g., external-dns.zone)
           3. Default zone
         """
-        # Check router name suffix (e.g., "myapp-internal@docker")
-        if router_name:
-            match = self.ZONE_SUFFIX_RE.search(router_name)
-            if match:
-                zone_str = match.group(1).lower()
-                return DNSZone.EXTERNAL if zone_str == "external" else DNSZone.INTERNAL
+        # Check router name suffix (e.g., "myapp-internal@docker"): the first
+        # "@"-separated segment ending in -internal/-external wins.
+        if router_name and "-" in router_name:
+            for segment in router_name.lower().split("@"):
+                if segment.endswith("-internal"):
+                    return DNSZone.INTERNAL
+                if segment.endswith("-external"):
+                    return DNSZone.EXTERNAL
 
         # Check for zone label in middleware or service metadata
         # Traefik API doesn't expose container labels directly, but we can
@@ -928,9 +1272,9 @@ class TraefikProxyProvider(ReverseProxyProvider):
         """
         if not pattern:
             return True
-        return fnmatch.fnmatch(router_name, pattern)
+        return _wildcard_matcher(pattern)(router_name)
 
-    def _has_middleware(self, router: Dict[str, Any], middleware_name: str) -> bool:
+    def _has_middleware(self, router: TraefikRouter, middleware_name: str) -> bool:
         """Check if router has the specified middleware.
 
         Args:
@@ -942,27 +1286,28 @@ class TraefikProxyProvider(ReverseProxyProvider):
         """
         if not middleware_name:
             return True
+        return self._uses_middleware(router, middleware_name.lower())
 
-        # Check middlewares list
+    @staticmethod
+    def _uses_middleware(router: TraefikRouter, middleware_name_lower: str) -> bool:
+        """Check a router's middlewares against an already lower-cased name."""
         middlewares = router.get("middlewares", [])
         if not isinstance(middlewares, list):
             return False
 
         # Check if any middleware matches (case-insensitive, supports @provider suffix)
-        middleware_name_lower = middleware_name.lower()
         for mw in middlewares:
             if not isinstance(mw, str):
                 continue
             # Strip @provider suffix for comparison
-            mw_base = mw.split("@")[0].lower()
-            if mw_base == middleware_name_lower:
+            if mw.partition("@")[0].lower() == middleware_name_lower:
                 return True
 
         return False
 
     def _extract_hostnames(self, rule: str) -> List[str]:
         """Extract hostnames from a Traefik router rule."""
-        return sorted({m.group(1) for m in self.HOST_RULE_RE.finditer(rule or "")})
+        return list(_hostnames_in_rule(rule))
 
 
 # =============================================================================
@@ -1035,28 +1380,52 @@ def create_proxy_provider(default_zone: Optional[str] = None) -> ReverseProxyPro
 # =============================================================================
 
 
-def _parse_bool(value: Any, *, default: bool = True) -> bool:
-    if value is None:
-        return default
-    if isinstance(value, bool):
-        return value
-    return str(value).strip().lower() in {"1", "true", "yes", "y", "on"}
+def _str_value(value: Any, default: str = "") -> str:
+    """Coerce an optional config value to a stripped string (default when unset)."""
+    if not value:
+        value = default
+    return value.strip() if isinstance(value, str) else str(value).strip()
 
 
 def _parse_exclude_patterns(value: Any) -> List[re.Pattern]:
     """Parse domain exclusion patterns from list or comma-separated string."""
-    patterns: List[re.Pattern] = []
     if not value:
-        return patterns
+        return []
 
     # Convert to list if string
     if isinstance(value, str):
-        items = [item.strip() for item in value.split(",")]
+        items = tuple(item.strip() for item in value.split(","))
     elif isinstance(value, list):
-        items = [str(item).strip() for item in value]
+        items = tuple(str(item).strip() for item in value)
     else:
-        return patterns
+        return []
 
+    return list(_compile_exclude_items(items))
+
+
+_WILDCARD_SPLIT_RE = re.compile(r"([*?])")
+
+
+def _wildcard_to_regex(item: str) -> str:
+    """Translate an fnmatch-style wildcard into a regex in a single pass.
+
+    Plain "*"/"?" wildcards become an anchored ^...$ pattern (the shape the literal
+    fast paths recognize); "[...]" character classes defer to fnmatch.translate,
+    anchored at the start since exclusions are matched with re.search.
+    """
+    if "[" in item:
+        return f"^{fnmatch.translate(item)}"
+    body = "".join(
+        ".*" if part == "*" else "." if part == "?" else re.escape(part)
+        for part in _WILDCARD_SPLIT_RE.split(item)
+    )
+    return f"^{body}$"
+
+
+@lru_cache(maxsize=128)
+def _compile_exclude_items(items: Tuple[str, ...]) -> Tuple[re.Pattern, ...]:
+    """Compile exclusion items, memoized so config reloads reuse prior patterns."""
+    patterns: List[re.Pattern] = []
     for item in items:
         if not item:
             continue
@@ -1066,12 +1435,9 @@ def _parse_exclude_patterns(value: Any) -> List[re.Pattern]:
                 # Explicit regex pattern
                 regex_str = item[1:]
                 patterns.append(re.compile(regex_str, re.IGNORECASE))
-            elif "*" in item or "?" in item:
+            elif "*" in item or "?" in item or "[" in item:
                 # Wildcard pattern - convert fnmatch to regex
-                regex_str = re.escape(item)
-                regex_str = regex_str.replace(r"\*", ".*").replace(r"\?", ".")
-                regex_str = f"^{regex_str}$"
-                patterns.append(re.compile(regex_str, re.IGNORECASE))
+                patterns.append(re.compile(_wildcard_to_regex(item), re.IGNORECASE))
             else:
                 # Exact match
                 patterns.append(re.compile(f"^{re.escape(item)}$", re.IGNORECASE))
@@ -1079,7 +1445,7 @@ def _parse_exclude_patterns(value: Any) -> List[re.Pattern]:
         except re.error as e:
             logger.warning(f"Invalid exclusion pattern '{item}': {e}")
 
-    return patterns
+    return tuple(patterns)
 
 
 def _is_domain_excluded(domain: str, patterns: List[re.Pattern]) -> bool:
@@ -1090,6 +1456,99 @@ def _is_domain_excluded(domain: str, patterns: List[re.Pattern]) -> bool:
     return False
 
 
+# Backreferences would be renumbered/ambiguous once patterns are joined together
+_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _literal_exclude(pattern: re.Pattern) -> Optional[Tuple[str, str]]:
+    """Recognize case-insensitive ^literal$, ^.*literal$ and ^literal.*$ exclusion patterns.
+
+    Returns (kind, lowercased literal) with kind "exact", "suffix" or "prefix" when
+    the pattern can be answered with plain string comparison, or None if it needs
+    the regex engine.
+    """
+    if pattern.flags & ~re.UNICODE != re.IGNORECASE:
+        return None
+    src = pattern.pattern
+    if len(src) < 2 or src[0] != "^" or src[-1] != "$":
+        return None
+    body = src[1:-1]
+    kind = "exact"
+    if body.startswith(".*"):
+        kind = "suffix"
+        body = body[2:]
+    elif body.endswith(".*") and not body.endswith("\\.*"):
+        kind = "prefix"
+        body = body[:-2]
+    literal = re.sub(r"\\(.)", r"\1", body)
+    if not literal or re.escape(literal) != body:
+        return None
+    return kind, literal.lower()
+
+
+def _compile_regex_matcher(patterns: List[re.Pattern]) -> Callable[[str], bool]:
+    """Join regex patterns into one alternation, or match them one by one."""
+    if not patterns:
+        return lambda domain: False
+
+    flags = patterns[0].flags
+    sources = [p.pattern for p in patterns]
+    if all(p.flags == flags for p in patterns) and not any(
+        _BACKREFERENCE_RE.search(src) for src in sources
+    ):
+        try:
+            combined = re.compile("|".join(f"(?:{src})" for src in sources), flags)
+        except re.error as e:
+            logger.debug(f"Cannot combine exclusion patterns, matching individually: {e}")
+        else:
+            return lambda domain: combined.search(domain) is not None
+
+    return lambda domain: _is_domain_excluded(domain, patterns)
+
+
+def _compile_exclude_matcher(patterns: List[re.Pattern]) -> Callable[[str], bool]:
+    """Build a single matcher callable from domain exclusion patterns.
+
+    Exact, "*.suffix" and "prefix*" patterns use a set lookup and str.endswith /
+    str.startswith. Other patterns are joined into one regex alternation where
+    they can be combined safely, else matched one by one.
+    """
+    if not patterns:
+        return lambda domain: False
+
+    exact: Set[str] = set()
+    literals: Dict[str, List[str]] = {"suffix": [], "prefix": []}
+    complex_patterns: List[re.Pattern] = []
+    for pattern in patterns:
+        literal = _literal_exclude(pattern)
+        if literal is None:
+            complex_patterns.append(pattern)
+        elif literal[0] == "exact":
+            exact.add(literal[1])
+        else:
+            literals[literal[0]].append(literal[1])
+
+    regex_matcher = _compile_regex_matcher(complex_patterns)
+    suffix_tuple = tuple(literals["suffix"])
+    prefix_tuple = tuple(literals["prefix"])
+    if not exact and not suffix_tuple and not prefix_tuple:
+        return regex_matcher
+
+    has_regex = bool(complex_patterns)
+
+    def matcher(domain: str) -> bool:
+        lowered = domain.lower()
+        if (
+            lowered in exact
+            or (suffix_tuple and lowered.endswith(suffix_tuple))
+            or (prefix_tuple and lowered.startswith(prefix_tuple))
+        ):
+            return True
+        return has_regex and regex_matcher(domain)
+
+    return matcher
+
+
 def _parse_static_rewrites(value: str, default_ip: str) -> Dict[str, str]:
     """Parse static rewrites from env var."""
     parsed: Dict[str, str] = {}
@@ -1101,20 +1560,18 @@ def _parse_static_rewrites(value: str, default_ip: str) -> Dict[str, str]:
         if not item:
             continue
 
-        if "=" in item:
-            domain, answer = item.split("=", 1)
-            domain = domain.strip()
-            answer = answer.strip()
-            if not domain:
-                continue
-            if not answer or answer.lower() == "true":
-                parsed[domain] = default_ip
-            else:
-                parsed[domain] = answer
-        else:
-            parsed[item] = default_ip
+        domain, _, answer = item.partition("=")
+        domain = domain.strip()
+        if not domain:
+            continue
+        answer = answer.strip()
+        # Bare domains and boolean-style answers ("true", "yes", ...) use the default IP
+        if not answer or answer.lower() in _TRUE_STRINGS:
+            answer = default_ip
+        if answer:
+            parsed[domain] = answer
 
-    return {domain: answer for domain, answer in parsed.items() if domain and answer}
+    return parsed
 
 
 # =============================================================================
@@ -1122,24 +1579,99 @@ def _parse_static_rewrites(value: str, default_ip: str) -> Dict[str, str]:
 # =============================================================================
 
 
+# Per-poll timestamps in the serialized state. Changes to these alone do not force a
+# rewrite; they are flushed with the next real change or once per flush interval.
+_STATE_TIMESTAMP_RE = re.compile(rb'"(?:last_seen|last_success)": ?\d+')
+
+
 class StateStore:
-    def __init__(self, path: str):
+    def __init__(
+        self,
+        path: str,
+        timestamp_flush_seconds: float = 300.0,
+        pretty: bool = False,
+        fsync: bool = True,
+    ):
         self.path = Path(path)
+        # Compact JSON by default; the state file is machine-managed
+        self.pretty = pretty
+        self.fsync = fsync
+        self.timestamp_flush_seconds = timestamp_flush_seconds
+        self._last_digest: Optional[bytes] = None
+        self._last_write = 0.0
+        # Serialized state whose write was deferred; load() serves it until it is flushed
+        self._pending: Optional[bytes] = None
+
+    @staticmethod
+    def _fsync_dir(directory: Path) -> None:
+        """Persist a rename by syncing its directory (best effort; unsupported on some OSes)."""
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+    @staticmethod
+    def _digest(data: bytes) -> bytes:
+        return hashlib.blake2b(_STATE_TIMESTAMP_RE.sub(b"", data), digest_size=16).digest()
 
     def load(self) -> Dict[str, Any]:
+        if self._pending is not None:
+            return _json_loads(self._pending)
         if not self.path.exists():
             return {"version": 1, "instances": {}, "domains": {}}
         try:
-            return json.loads(self.path.read_text("utf-8"))
+            data = self.path.read_bytes()
+            state = _json_loads(data)
         except Exception as e:
             logger.warning(f"Failed to load state file {self.path}: {e}")
             return {"version": 1, "instances": {}, "domains": {}}
+        if self._last_digest is None:
+            # Seed from the file on disk so an unchanged state is not rewritten after startup
+            self._last_digest = self._digest(data)
+            self._last_write = self.path.stat().st_mtime
+        return state
 
     def save(self, state: Dict[str, Any]) -> None:
+        data = _json_dumps_sorted(state, pretty=self.pretty)
+        digest = self._digest(data)
+        now = time.time()
+        # Skip the rewrite when nothing but poll timestamps changed since the last save
+        if (
+            digest == self._last_digest
+            and now - self._last_write < self.timestamp_flush_seconds
+            and self.path.exists()
+        ):
+            self._pending = data
+            return
+        self._write(data, digest, now)
+
+    def flush(self) -> None:
+        """Write any deferred timestamp-only changes to disk."""
+        if self._pending is not None:
+            data = self._pending
+            self._write(data, self._digest(data), time.time())
+
+    def _write(self, data: bytes, digest: bytes, now: float) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
-        tmp_path.write_text(json.dumps(state, indent=2, sort_keys=True), "utf-8")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            if self.fsync:
+                # Data must be on disk before the rename makes it the live state file
+                f.flush()
+                os.fsync(f.fileno())
         tmp_path.replace(self.path)
+        if self.fsync:
+            self._fsync_dir(self.path.parent)
+        self._last_digest = digest
+        self._last_write = now
+        self._pending = None
 
 
 # =============================================================================
@@ -1147,6 +1679,18 @@ class StateStore:
 # =============================================================================
 
 
+def _group_records_by_domain(records: Iterable[DNSRecord]) -> Dict[str, List[str]]:
+    """Index DNS records as domain -> answers, keeping duplicate answers visible."""
+    records_by_domain: Dict[str, List[str]] = {}
+    for r in records:
+        answers = records_by_domain.get(r.domain)
+        if answers is None:
+            records_by_domain[r.domain] = [r.answer]
+        else:
+            answers.append(r.answer)
+    return records_by_domain
+
+
 class ExternalDNSSyncer:
     def __init__(
         self,
@@ -1156,51 +1700,87 @@ class ExternalDNSSyncer:
         state_store: StateStore,
         static_rewrites: Dict[str, str],
         exclude_patterns: List[re.Pattern],
+        max_route_workers: int = 8,
+        resync_interval: float = 0.0,
     ):
         self.dns_provider = dns_provider
         self.proxy_provider = proxy_provider
         self.state_store = state_store
         self.static_rewrites = static_rewrites
-        self.exclude_patterns = exclude_patterns
+        self.exclude_patterns: List[re.Pattern] = []
+        self._is_excluded = _compile_exclude_matcher([])
+        self.set_exclude_patterns(exclude_patterns)
+        self.max_route_workers = max(1, max_route_workers)
+        self.resync_interval = resync_interval
         self._startup_cleanup_done = False
+        # Desired records of the last reconcile that applied cleanly, and when it ran
+        self._last_desired: Optional[Dict[str, str]] = None
+        self._last_reconcile = 0.0
+
+    def set_exclude_patterns(self, patterns: List[re.Pattern]) -> None:
+        """Replace the domain exclusion patterns, recompiling the matcher only on change."""
+        if patterns == self.exclude_patterns:
+            return
+        self.exclude_patterns = patterns
+        # Force a full reconcile so newly excluded records get cleaned up
+        self._last_desired = None
+        matcher = _compile_exclude_matcher(patterns)
+        # Hostnames recur across routers, instances and cycles; memoize per pattern set
+        self._is_excluded = lru_cache(maxsize=4096)(matcher) if patterns else matcher
 
     def _is_record_managed(self, state: Dict[str, Any], domain: str, answer: str) -> bool:
         """Check if a DNS record was created by external-dns."""
         managed = state.get("managed_records", {})
-        return answer in managed.get(domain, [])
+        return answer in managed.get(domain, ())
 
     def _mark_record_managed(self, state: Dict[str, Any], domain: str, answer: str) -> None:
         """Track a DNS record as managed by external-dns."""
         managed = state.setdefault("managed_records", {})
-        domain_answers = managed.setdefault(domain, [])
-        if answer not in domain_answers:
-            domain_answers.append(answer)
+        managed.setdefault(domain, set()).add(answer)
 
     def _unmark_record_managed(self, state: Dict[str, Any], domain: str, answer: str) -> None:
         """Remove a DNS record from managed tracking."""
         managed = state.get("managed_records", {})
-        if domain in managed:
-            if answer in managed[domain]:
-                managed[domain].remove(answer)
-            if not managed[domain]:
+        domain_answers = managed.get(domain)
+        if domain_answers is not None:
+            domain_answers.discard(answer)
+            if not domain_answers:
+                del managed[domain]
+
+    def _unmark_records_managed(
+        self, state: Dict[str, Any], domain: str, answers: Iterable[str]
+    ) -> None:
+        """Remove several answers for one domain from managed tracking at once."""
+        managed = state.get("managed_records", {})
+        domain_answers = managed.get(domain)
+        if domain_answers is not None:
+            domain_answers.difference_update(answers)
+            if not domain_answers:
                 del managed[domain]
 
-    def _sync_static_rewrites(self, state: Dict[str, Any]) -> None:
+    def _sync_static_rewrites(
+        self, state: Dict[str, Any], records_by_domain: Dict[str, List[str]]
+    ) -> bool:
+        """Ensure static rewrites exist; returns False if any DNS write failed."""
         if not self.static_rewrites:
-            return
+            return True
 
-        current_records = {r.domain: r.answer for r in self.dns_provider.get_records()}
+        ok = True
 
         for domain, answer in self.static_rewrites.items():
-            if domain in current_records:
-                current_answer = current_records[domain]
+            current_answers = records_by_domain.get(domain)
+            if current_answers:
+                current_answer = current_answers[-1]
                 if current_answer == answer:
                     # Record already exists with correct answer - mark as managed
                     self._mark_record_managed(state, domain, answer)
                 elif self._is_record_managed(state, domain, current_answer):
                     # Record is managed by us with wrong answer - update it
                     logger.info(f"Updating static rewrite {domain}: {current_answer} -> {answer}")
-                    self.dns_provider.update_record(domain, current_answer, answer)
+                    if self.dns_provider.update_record(domain, current_answer, answer):
+                        current_answers[-1] = answer
+                    else:
+                        ok = False
                     self._unmark_record_managed(state, domain, current_answer)
                     self._mark_record_managed(state, domain, answer)
                 else:
@@ -1211,40 +1791,40 @@ class ExternalDNSSyncer:
                     )
             else:
                 logger.info(f"Adding static rewrite {domain} -> {answer}")
-                self.dns_provider.add_record(domain, answer)
+                if self.dns_provider.add_record(domain, answer):
+                    records_by_domain.setdefault(domain, []).append(answer)
+                else:
+                    ok = False
                 self._mark_record_managed(state, domain, answer)
+        return ok
 
     def _cleanup_removed_instances(
-        self, state: Dict[str, Any], instances: List[ProxyInstance]
+        self,
+        state: Dict[str, Any],
+        instances: List[ProxyInstance],
+        records_by_domain: Dict[str, List[str]],
     ) -> None:
         """Remove all DNS records from proxy instances that are no longer configured."""
         configured_names = {i.name for i in instances}
         state_instances = state.get("instances", {})
-        removed_instances = set(state_instances.keys()) - configured_names
+        removed_instances = state_instances.keys() - configured_names
 
         if not removed_instances:
             return
 
         logger.info(f"Detected removed proxy instances: {', '.join(sorted(removed_instances))}")
 
-        # Get current DNS records for cleanup
-        all_records = self.dns_provider.get_records()
-        records_by_domain: Dict[str, List[str]] = {}
-        for r in all_records:
-            records_by_domain.setdefault(r.domain, []).append(r.answer)
-
         # Find and remove domains that were exclusively owned by removed instances
         domains_to_cleanup: List[str] = []
-        for domain, domain_state in list(state.get("domains", {}).items()):
+        for domain, domain_state in state.get("domains", {}).items():
             sources = domain_state.get("sources", {})
             if not sources:
                 continue
 
             # Remove the removed instances from this domain's sources
-            for removed_name in removed_instances:
-                if removed_name in sources:
-                    del sources[removed_name]
-                    logger.debug(f"Removed source '{removed_name}' from domain '{domain}'")
+            for removed_name in sources.keys() & removed_instances:
+                del sources[removed_name]
+                logger.debug(f"Removed source '{removed_name}' from domain '{domain}'")
 
             # If no sources remain, mark for cleanup
             if not sources:
@@ -1257,12 +1837,14 @@ class ExternalDNSSyncer:
                 logger.debug(f"Skipping static rewrite '{domain}' during instance cleanup")
                 continue
 
-            for answer in records_by_domain.get(domain, []):
+            answers = records_by_domain.get(domain, [])
+            for answer in list(answers):
                 if self._is_record_managed(state, domain, answer):
                     logger.info(
                         f"Removing orphaned record from removed instance: {domain} -> {answer}"
                     )
-                    self.dns_provider.delete_record(domain, answer)
+                    if self.dns_provider.delete_record(domain, answer):
+                        answers.remove(answer)
                     self._unmark_record_managed(state, domain, answer)
                 else:
                     logger.debug(
@@ -1277,30 +1859,198 @@ class ExternalDNSSyncer:
             state["instances"].pop(removed_name, None)
             logger.info(f"Cleaned up state for removed instance: {removed_name}")
 
+    def _plan_record_changes(
+        self,
+        state: Dict[str, Any],
+        desired: Dict[str, str],
+        records_by_domain: Dict[str, List[str]],
+        stale_domains: List[str],
+    ) -> SyncPlan:
+        """Reconcile desired records against current DNS records into a SyncPlan.
+
+        Managed-record bookkeeping in state is updated as changes are planned; no
+        DNS provider calls are made here.
+        """
+        plan = SyncPlan()
+        is_excluded = self._is_excluded
+        mark = self._mark_record_managed
+        unmark = self._unmark_record_managed
+        is_managed = self._is_record_managed
+
+        # Clean up existing DNS records that match exclusion patterns (only managed records)
+        if self.exclude_patterns:
+            excluded_domains: List[str] = []
+            for domain, answers in records_by_domain.items():
+                # Skip static rewrites
+                if domain in self.static_rewrites:
+                    continue
+                if is_excluded(domain):
+                    deleted_any = False
+                    for answer in answers:
+                        if is_managed(state, domain, answer):
+                            logger.info(f"Removing excluded domain from DNS: {domain} -> {answer}")
+                            plan.deletes.append((domain, answer))
+                            unmark(state, domain, answer)
+                            deleted_any = True
+                        else:
+                            logger.debug(
+                                f"Skipping pre-existing excluded record: {domain} -> {answer}"
+                            )
+                    # Also remove from state if present
+                    state["domains"].pop(domain, None)
+                    # Remove from records_by_domain so we don't process it later
+                    if deleted_any:
+                        excluded_domains.append(domain)
+            for domain in excluded_domains:
+                del records_by_domain[domain]
+
+        # Apply creates/updates, handling duplicates (respecting managed records).
+        managed_records: Dict[str, Set[str]] = state["managed_records"]
+        for domain, answer in desired.items():
+            existing_answers = records_by_domain.get(domain, [])
+
+            if not existing_answers:
+                # No existing record - add it and mark as managed
+                logger.info(f"Adding record {domain} -> {answer}")
+                plan.adds.append((domain, answer))
+                mark(state, domain, answer)
+            elif len(existing_answers) == 1 and existing_answers[0] == answer:
+                # Exactly one record with correct answer - adopt it as managed
+                mark(state, domain, answer)
+            else:
+                # Either wrong answer(s) or duplicates exist
+                # Partition into records we manage and pre-existing ones in a single pass
+                domain_managed = managed_records.get(domain, ())
+                managed_answers: List[str] = []
+                unmanaged_answers: List[str] = []
+                for a in existing_answers:
+                    (managed_answers if a in domain_managed else unmanaged_answers).append(a)
+
+                if unmanaged_answers:
+                    # There are pre-existing records we didn't create
+                    if answer in unmanaged_answers:
+                        # Desired answer already exists as pre-existing - adopt it
+                        logger.debug(f"Adopting pre-existing record {domain} -> {answer}")
+                        mark(state, domain, answer)
+                        # Clean up any managed duplicates
+                        for old_answer in managed_answers:
+                            if old_answer != answer:
+                                logger.info(f"Removing managed duplicate {domain} -> {old_answer}")
+                                plan.deletes.append((domain, old_answer))
+                                unmark(state, domain, old_answer)
+                    else:
+                        # Pre-existing record(s) with different answer - warn and skip
+                        logger.warning(
+                            f"Domain {domain} has pre-existing record(s) {unmanaged_answers} "
+                            f"(not managed by external-dns); skipping desired {answer}"
+                        )
+                        # Still clean up our managed records for this domain
+                        for old_answer in managed_answers:
+                            logger.info(
+                                f"Removing obsolete managed record {domain} -> {old_answer}"
+                            )
+                            plan.deletes.append((domain, old_answer))
+                        self._unmark_records_managed(state, domain, managed_answers)
+                else:
+                    # All records are managed by us - clean up and recreate
+                    if len(existing_answers) > 1:
+                        logger.warning(
+                            f"Found {len(existing_answers)} duplicate records for {domain}, consolidating"
+                        )
+                    if existing_answers.count(answer) == 1:
+                        # The correct record is already present once: keep it rather
+                        # than deleting and re-adding the same answer.
+                        stale = [a for a in existing_answers if a != answer]
+                        for old_answer in stale:
+                            plan.deletes.append((domain, old_answer))
+                        self._unmark_records_managed(state, domain, stale)
+                    else:
+                        # Delete all existing managed entries
+                        for old_answer in existing_answers:
+                            plan.deletes.append((domain, old_answer))
+                        self._unmark_records_managed(state, domain, existing_answers)
+                        # Re-add the single correct record
+                        plan.adds.append((domain, answer))
+                        mark(state, domain, answer)
+
+        # Apply deletions for domains that now have no sources AND were confirmed absent.
+        for domain in stale_domains:
+            # Static rewrites are intentionally not auto-removed.
+            if domain in self.static_rewrites:
+                continue
+
+            # Delete only managed records for this domain
+            for old_answer in records_by_domain.get(domain, []):
+                if is_managed(state, domain, old_answer):
+                    logger.info(f"Removing record {domain} -> {old_answer}")
+                    plan.deletes.append((domain, old_answer))
+                    unmark(state, domain, old_answer)
+                else:
+                    logger.debug(f"Preserving pre-existing record {domain} -> {old_answer}")
+            state["domains"].pop(domain, None)
+
+        return plan
+
+    def _apply_record_changes(self, plan: SyncPlan) -> bool:
+        """Send a plan's record deletions, then additions, to the DNS provider.
+
+        Returns False if any change failed.
+        """
+        ok = True
+        for action, batch, apply in (
+            ("delete", plan.deletes, self.dns_provider.delete_records),
+            ("add", plan.adds, self.dns_provider.add_records),
+        ):
+            if not batch:
+                continue
+            failed = [pair for pair, done in apply(batch).items() if not done]
+            if failed:
+                ok = False
+                logger.warning(
+                    f"Failed to {action} {len(failed)} of {len(batch)} record(s): "
+                    f"{', '.join(f'{d} -> {a}' for d, a in failed)}"
+                )
+        return ok
+
+    def _fetch_routes_concurrently(self, instances: List[ProxyInstance]) -> List[Future]:
+        """Start get_routes for every instance in parallel.
+
+        Returns futures in the same order as instances so results can be
+        processed in configured order; each future re-raises its instance's
+        exception from result().
+        """
+        if not instances:
+            return []
+        workers = min(self.max_route_workers, len(instances))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [executor.submit(self.proxy_provider.get_routes, i) for i in instances]
+
     def sync_once(self) -> None:
         now = int(time.time())
         state = self.state_store.load()
         state.setdefault("version", 1)
         state.setdefault("instances", {})
         state.setdefault("domains", {})
-        state.setdefault("managed_records", {})
+        # Managed answers are sets in memory; StateStore.save writes them as sorted lists
+        state["managed_records"] = {
+            domain: set(answers)
+            for domain, answers in state.get("managed_records", {}).items()
+            if isinstance(answers, (list, set))
+        }
 
         instances = self.proxy_provider.get_instances()
 
-        # On first sync after startup, clean up records from removed proxy instances
-        if not self._startup_cleanup_done:
-            self._cleanup_removed_instances(state, instances)
-            self._startup_cleanup_done = True
-
-        # Ensure static rewrites first.
-        self._sync_static_rewrites(state)
-
         instance_success: Dict[str, bool] = {}
         instance_seen_domains: Dict[str, Set[str]] = {}
+        domains: Dict[str, Any] = state["domains"]
+        is_excluded = self._is_excluded
 
-        for instance in instances:
+        for instance, pending in zip(
+            instances, self._fetch_routes_concurrently(instances), strict=True
+        ):
+            iname = instance.name
             try:
-                routes = self.proxy_provider.get_routes(instance)
+                routes = pending.result()
 
                 seen: Set[str] = set()
                 excluded_count = 0
@@ -1308,7 +2058,7 @@ class ExternalDNSSyncer:
                 for route in routes:
                     hostname = route.hostname
                     # Skip domains matching exclusion patterns
-                    if _is_domain_excluded(hostname, self.exclude_patterns):
+                    if is_excluded(hostname):
                         excluded_count += 1
                         logger.debug(f"Excluding domain '{hostname}' (matches exclusion pattern)")
                         continue
@@ -1321,16 +2071,26 @@ class ExternalDNSSyncer:
                         )
                         continue
                     seen.add(hostname)
-                    domain_state = state["domains"].setdefault(hostname, {"sources": {}})
-                    sources = domain_state.setdefault("sources", {})
-                    sources[instance.name] = {
-                        "answer": route.target_ip,
-                        "last_seen": now,
-                    }
+                    # get-then-insert avoids building throwaway setdefault defaults
+                    # for the (common) already-known domain.
+                    domain_state = domains.get(hostname)
+                    if domain_state is None:
+                        domain_state = domains[hostname] = {"sources": {}}
+                    sources = domain_state.get("sources")
+                    if sources is None:
+                        sources = domain_state["sources"] = {}
+                    # Refresh an existing source entry in place rather than
+                    # allocating a replacement dict for every domain each cycle.
+                    src = sources.get(iname)
+                    if isinstance(src, dict):
+                        src["answer"] = route.target_ip
+                        src["last_seen"] = now
+                    else:
+                        sources[iname] = {"answer": route.target_ip, "last_seen": now}
 
-                instance_success[instance.name] = True
-                instance_seen_domains[instance.name] = seen
-                state["instances"][instance.name] = {
+                instance_success[iname] = True
+                instance_seen_domains[iname] = seen
+                state["instances"][iname] = {
                     "last_success": now,
                     "last_error": "",
                     "url": instance.url,
@@ -1341,188 +2101,143 @@ class ExternalDNSSyncer:
                 if external_count:
                     stats_parts.append(f"{external_count} external")
                 stats_msg = f" ({', '.join(stats_parts)})" if stats_parts else ""
-                logger.info(
-                    f"Proxy instance '{instance.name}': {len(seen)} internal domains{stats_msg}"
-                )
+                logger.info(f"Proxy instance '{iname}': {len(seen)} internal domains{stats_msg}")
 
             except requests.exceptions.RequestException as e:
-                instance_success[instance.name] = False
-                instance_seen_domains[instance.name] = set()
+                instance_success[iname] = False
+                instance_seen_domains[iname] = set()
                 error_detail = str(e)
                 if hasattr(e, "response") and e.response is not None:
                     error_detail = f"HTTP {e.response.status_code}: {e}"
-                prev = state["instances"].get(instance.name, {})
-                state["instances"][instance.name] = {
+                prev = state["instances"].get(iname, {})
+                state["instances"][iname] = {
                     "last_success": prev.get("last_success", 0),
                     "last_error": error_detail,
                     "url": instance.url,
                 }
                 logger.warning(
-                    f"Proxy instance '{instance.name}' ({instance.url}) unreachable: {error_detail}"
+                    f"Proxy instance '{iname}' ({instance.url}) unreachable: {error_detail}"
                 )
 
+        # Order domains once so every later pass (and its logging) runs in sorted
+        # order without re-sorting desired/deletion lists.
+        state["domains"] = dict(sorted(state["domains"].items()))
+
         # Prune sources ONLY for instances that were successfully polled.
+        # Walk each domain's own sources (usually one or two) rather than every instance.
+        polled_seen = {
+            name: instance_seen_domains[name] for name, ok in instance_success.items() if ok
+        }
         domains_to_delete_from_state: List[str] = []
-        for domain, domain_state in list(state["domains"].items()):
-            sources: Dict[str, Any] = domain_state.get("sources", {})
+        for domain, domain_state in state["domains"].items():
+            sources: Dict[str, Any] = domain_state.get("sources")
             if not isinstance(sources, dict):
                 sources = {}
                 domain_state["sources"] = sources
 
-            for instance in instances:
-                if not instance_success.get(instance.name, False):
-                    continue
-                if instance.name not in sources:
-                    continue
-                if domain not in instance_seen_domains.get(instance.name, set()):
+            if polled_seen:
+                absent = [
+                    name
+                    for name in sources
+                    if name in polled_seen and domain not in polled_seen[name]
+                ]
+                for name in absent:
                     # Confirmed absent on this proxy instance.
-                    del sources[instance.name]
+                    del sources[name]
 
             if not sources:
                 domains_to_delete_from_state.append(domain)
 
         # Compute desired global records (one answer per domain).
         desired: Dict[str, str] = {}
+        # Configured position of each instance; a domain's few sources are ranked
+        # against this instead of scanning every instance per domain.
+        instance_rank: Dict[str, int] = {}
+        for rank, instance in enumerate(instances):
+            instance_rank.setdefault(instance.name, rank)
+        no_rank = len(instances)
         for domain, domain_state in state["domains"].items():
-            sources: Dict[str, Any] = domain_state.get("sources", {})
+            sources: Dict[str, Any] = domain_state.get("sources")
             if not sources:
                 continue
 
             # Pick the answer from the first instance in configured order.
             chosen_answer: Optional[str] = None
             chosen_source: Optional[str] = None
-            for instance in instances:
-                src = sources.get(instance.name)
-                if src and src.get("answer"):
+            chosen_rank = no_rank
+            for name, src in sources.items():
+                rank = instance_rank.get(name, no_rank)
+                if rank < chosen_rank and src.get("answer"):
                     chosen_answer = str(src["answer"])
-                    chosen_source = instance.name
-                    break
+                    chosen_source = name
+                    chosen_rank = rank
 
             if not chosen_answer:
                 continue
 
-            # Log conflicts if multiple instances disagree.
-            distinct_answers = sorted(
-                {str(v.get("answer")) for v in sources.values() if v.get("answer")}
-            )
-            if len(distinct_answers) > 1:
+            # Log conflicts if multiple instances disagree. Stop at the first differing
+            # answer; the full distinct set is only built for the warning itself.
+            first_answer: Optional[str] = None
+            has_conflict = False
+            for v in sources.values():
+                a = v.get("answer")
+                if not a:
+                    continue
+                a = str(a)
+                if first_answer is None:
+                    first_answer = a
+                elif a != first_answer:
+                    has_conflict = True
+                    break
+            if has_conflict:
+                distinct_answers = {
+                    str(v.get("answer")) for v in sources.values() if v.get("answer")
+                }
                 logger.warning(
-                    f"Domain '{domain}' present on multiple proxy instances with different target IPs {distinct_answers}; "
+                    f"Domain '{domain}' present on multiple proxy instances with different target IPs {sorted(distinct_answers)}; "
                     f"using '{chosen_answer}' from '{chosen_source}'"
                 )
 
             desired[domain] = chosen_answer
 
-        all_records = self.dns_provider.get_records()
-
-        # Build a mapping of domain -> list of answers (to detect duplicates)
-        records_by_domain: Dict[str, List[str]] = {}
-        for r in all_records:
-            records_by_domain.setdefault(r.domain, []).append(r.answer)
-
-        # Clean up existing DNS records that match exclusion patterns (only managed records)
-        if self.exclude_patterns:
-            for domain, answers in list(records_by_domain.items()):
-                # Skip static rewrites
-                if domain in self.static_rewrites:
-                    continue
-                if _is_domain_excluded(domain, self.exclude_patterns):
-                    deleted_any = False
-                    for answer in answers:
-                        if self._is_record_managed(state, domain, answer):
-                            logger.info(f"Removing excluded domain from DNS: {domain} -> {answer}")
-                            self.dns_provider.delete_record(domain, answer)
-                            self._unmark_record_managed(state, domain, answer)
-                            deleted_any = True
-                        else:
-                            logger.debug(
-                                f"Skipping pre-existing excluded record: {domain} -> {answer}"
-                            )
-                    # Also remove from state if present
-                    state["domains"].pop(domain, None)
-                    # Remove from records_by_domain so we don't process it later
-                    if deleted_any:
-                        del records_by_domain[domain]
-
-        # Apply creates/updates, handling duplicates (respecting managed records).
-        for domain, answer in sorted(desired.items()):
-            existing_answers = records_by_domain.get(domain, [])
+        # Steady state: every instance answered, nothing left to delete and the
+        # desired records match the last clean reconcile, so DNS needs no changes.
+        # A full reconcile still runs every resync_interval to repair external drift.
+        if (
+            desired == self._last_desired
+            and not domains_to_delete_from_state
+            and all(instance_success.values())
+            and time.monotonic() - self._last_reconcile < self.resync_interval
+        ):
+            logger.debug(f"No route changes across {len(desired)} domains; skipping reconcile")
+            self.state_store.save(state)
+            return
 
-            if not existing_answers:
-                # No existing record - add it and mark as managed
-                logger.info(f"Adding record {domain} -> {answer}")
-                self.dns_provider.add_record(domain, answer)
-                self._mark_record_managed(state, domain, answer)
-            elif len(existing_answers) == 1 and existing_answers[0] == answer:
-                # Exactly one record with correct answer - adopt it as managed
-                self._mark_record_managed(state, domain, answer)
-            else:
-                # Either wrong answer(s) or duplicates exist
-                # Check which records we can manage
-                managed_answers = [
-                    a for a in existing_answers if self._is_record_managed(state, domain, a)
-                ]
-                unmanaged_answers = [
-                    a for a in existing_answers if not self._is_record_managed(state, domain, a)
-                ]
+        # Fetch DNS records once per cycle: domain -> list of answers (to detect
+        # duplicates). Writes below keep this mapping in step instead of re-fetching.
+        records_by_domain = _group_records_by_domain(self.dns_provider.get_records())
 
-                if unmanaged_answers:
-                    # There are pre-existing records we didn't create
-                    if answer in unmanaged_answers:
-                        # Desired answer already exists as pre-existing - adopt it
-                        logger.debug(f"Adopting pre-existing record {domain} -> {answer}")
-                        self._mark_record_managed(state, domain, answer)
-                        # Clean up any managed duplicates
-                        for old_answer in managed_answers:
-                            if old_answer != answer:
-                                logger.info(f"Removing managed duplicate {domain} -> {old_answer}")
-                                self.dns_provider.delete_record(domain, old_answer)
-                                self._unmark_record_managed(state, domain, old_answer)
-                    else:
-                        # Pre-existing record(s) with different answer - warn and skip
-                        logger.warning(
-                            f"Domain {domain} has pre-existing record(s) {unmanaged_answers} "
-                            f"(not managed by external-dns); skipping desired {answer}"
-                        )
-                        # Still clean up our managed records for this domain
-                        for old_answer in managed_answers:
-                            logger.info(
-                                f"Removing obsolete managed record {domain} -> {old_answer}"
-                            )
-                            self.dns_provider.delete_record(domain, old_answer)
-                            self._unmark_record_managed(state, domain, old_answer)
-                else:
-                    # All records are managed by us - clean up and recreate
-                    if len(existing_answers) > 1:
-                        logger.warning(
-                            f"Found {len(existing_answers)} duplicate records for {domain}, consolidating"
-                        )
-                    # Delete all existing managed entries
-                    for old_answer in existing_answers:
-                        self.dns_provider.delete_record(domain, old_answer)
-                        self._unmark_record_managed(state, domain, old_answer)
-                    # Re-add the single correct record
-                    self.dns_provider.add_record(domain, answer)
-                    self._mark_record_managed(state, domain, answer)
+        # On first sync after startup, clean up records from removed proxy instances
+        if not self._startup_cleanup_done:
+            self._cleanup_removed_instances(state, instances, records_by_domain)
+            self._startup_cleanup_done = True
 
-        # Apply deletions for domains that now have no sources AND were confirmed absent.
-        for domain in sorted(domains_to_delete_from_state):
-            # Static rewrites are intentionally not auto-removed.
-            if domain in self.static_rewrites:
-                continue
+        # Ensure static rewrites first.
+        static_ok = self._sync_static_rewrites(state, records_by_domain)
 
-            # Delete only managed records for this domain
-            for old_answer in records_by_domain.get(domain, []):
-                if self._is_record_managed(state, domain, old_answer):
-                    logger.info(f"Removing record {domain} -> {old_answer}")
-                    self.dns_provider.delete_record(domain, old_answer)
-                    self._unmark_record_managed(state, domain, old_answer)
-                else:
-                    logger.debug(f"Preserving pre-existing record {domain} -> {old_answer}")
-            state["domains"].pop(domain, None)
+        # Plan every DNS write first, then send them in two batches: all deletions,
+        # then all additions (preserving per-domain delete-then-add order).
+        plan = self._plan_record_changes(
+            state, desired, records_by_domain, domains_to_delete_from_state
+        )
+        applied_ok = self._apply_record_changes(plan)
 
         self.state_store.save(state)
 
+        # Only a fully applied reconcile can be trusted as the baseline for skipping
+        self._last_desired = desired if static_ok and applied_ok else None
+        self._last_reconcile = time.monotonic()
+
 
 # =============================================================================
 # Main
@@ -1606,11 +2321,14 @@ def validate_config() -> bool:
 
 def main():
     """Main entry point."""
+    # Configure logging from env first so config loading can already log
+    _configure_logging(os.getenv("LOG_LEVEL", "INFO"))
+
     # Load settings from config file (env vars override)
     settings = load_settings_from_yaml(CONFIG_PATH)
 
     # Reconfigure logging with settings from config
-    logging.getLogger().setLevel(getattr(logging, settings.log_level, logging.INFO))
+    _configure_logging(settings.log_level)
 
     logger.info(f"external-dns: {PROXY_PROVIDER} -> {DNS_PROVIDER}")
 
@@ -1653,8 +2371,8 @@ def main():
     if static_rewrites:
         logger.info(f"Static rewrites: {', '.join(sorted(static_rewrites.keys()))}")
 
-    # Parse domain exclusion patterns
-    exclude_patterns = _parse_exclude_patterns(settings.exclude_domains)
+    # Domain exclusion patterns (compiled when settings were loaded)
+    exclude_patterns = settings.exclude_patterns
     if exclude_patterns:
         logger.info(f"Domain exclusions: {len(exclude_patterns)} pattern(s) configured")
 
@@ -1666,9 +2384,10 @@ def main():
     syncer = ExternalDNSSyncer(
         dns_provider=dns_provider,
         proxy_provider=proxy_provider,
-        state_store=StateStore(STATE_PATH),
+        state_store=StateStore(STATE_PATH, pretty=STATE_PRETTY, fsync=STATE_FSYNC),
         static_rewrites=static_rewrites,
         exclude_patterns=exclude_patterns,
+        resync_interval=settings.resync_interval,
     )
 
     # Register signal handlers for graceful shutdown
@@ -1685,9 +2404,8 @@ def main():
             logger.error(f"Invalid sync_mode: {settings.sync_mode}. Use 'once' or 'watch'")
             sys.exit(1)
 
-        # Track all config files modification times for auto-reload
-        config_files = find_config_files(CONFIG_PATH)
-        last_config_mtimes = get_config_files_mtimes(config_files)
+        # Track all config files (and their mtime/size) for auto-reload
+        config_snapshot = snapshot_config_files(CONFIG_PATH)
 
         # Cycle counter for health check logging
         cycle_count = 0
@@ -1706,21 +2424,14 @@ def main():
             if cycle_count % 10 == 0:
                 logger.info(f"Health check: {cycle_count} sync cycles completed")
 
-            # Check for new config files or changes to existing ones
-            current_config_files = find_config_files(CONFIG_PATH)
-            current_mtimes = get_config_files_mtimes(current_config_files)
-
-            # Detect changes: new files, deleted files, or modified files
-            files_changed = (
-                set(current_config_files) != set(config_files)
-                or current_mtimes != last_config_mtimes
-            )
+            # Check for new config files or changes to existing ones: one listing plus
+            # one stat per file, compared as a single dict
+            current_snapshot = snapshot_config_files(CONFIG_PATH)
 
-            if files_changed:
-                changed_files = []
-                if set(current_config_files) != set(config_files):
-                    new_files = set(current_config_files) - set(config_files)
-                    removed_files = set(config_files) - set(current_config_files)
+            if current_snapshot != config_snapshot:
+                new_files = current_snapshot.keys() - config_snapshot.keys()
+                removed_files = config_snapshot.keys() - current_snapshot.keys()
+                if new_files or removed_files:
                     if new_files:
                         logger.info(
                             f"New config file(s) detected: {', '.join([Path(f).name for f in new_files])}"
@@ -1731,17 +2442,16 @@ def main():
                         )
                     changed_files = list(new_files) + list(removed_files)
                 else:
-                    for f in current_config_files:
-                        if current_mtimes.get(f, 0) != last_config_mtimes.get(f, 0):
-                            changed_files.append(f)
+                    changed_files = [
+                        f for f, sig in current_snapshot.items() if config_snapshot.get(f) != sig
+                    ]
 
                 if changed_files:
                     logger.info(
                         f"Config change detected in: {', '.join([Path(f).name for f in changed_files])}"
                     )
 
-                config_files = current_config_files
-                last_config_mtimes = current_mtimes
+                config_snapshot = current_snapshot
 
                 # Recreate proxy provider with new config
                 try:
@@ -1753,8 +2463,9 @@ def main():
                         f"Reloaded {len(instances)} instance(s): {', '.join([i.name for i in instances])}"
                     )
 
-                    # Update syncer with new provider
+                    # Update syncer with new provider and exclusions
                     syncer.proxy_provider = proxy_provider
+                    syncer.set_exclude_patterns(settings.exclude_patterns)
 
                     # Trigger immediate sync after config reload
                     logger.info("Triggering immediate sync after config reload")
@@ -1766,6 +2477,7 @@ def main():
             # Interruptible sleep - will return immediately if shutdown signal received
             _shutdown_event.wait(max(5, settings.poll_interval))
 
+        syncer.state_store.flush()
         logger.info("Shutdown complete.")
     except Exception as e:
         logger.error(f"Fatal error: {e}", exc_info=True)
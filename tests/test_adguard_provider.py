@@ -1,5 +1,6 @@
 """Unit tests for AdGuardDNSProvider."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import requests
@@ -57,7 +58,7 @@ class TestAdGuardGetRecords:
         with patch.object(provider._session, "get") as mock_get:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = mock_response_data
+            mock_response.content = json.dumps(mock_response_data).encode()
             mock_get.return_value = mock_response
 
             records = provider.get_records()
@@ -187,6 +188,60 @@ class TestAdGuardUpdateRecord:
                 mock_add.assert_not_called()
 
 
+class TestAdGuardBatchRecords:
+    """Tests for AdGuard add_records/delete_records batch functionality."""
+
+    def test_add_records_posts_each_record(self) -> None:
+        """Test add_records issues one add request per record and reports results."""
+        provider = AdGuardDNSProvider(
+            url="http://adguard.local", username="admin", password="secret"
+        )
+        records = [("a.example.com", "10.0.0.1"), ("b.example.com", "10.0.0.2")]
+
+        with patch.object(provider._session, "post") as mock_post:
+            mock_post.return_value = MagicMock()
+
+            results = provider.add_records(records)
+
+        assert results == {record: True for record in records}
+        posted = sorted(call.kwargs["json"]["domain"] for call in mock_post.call_args_list)
+        assert posted == ["a.example.com", "b.example.com"]
+        for call in mock_post.call_args_list:
+            assert call.args[0] == "http://adguard.local/control/rewrite/add"
+
+    def test_delete_records_reports_individual_failures(self) -> None:
+        """Test delete_records returns False only for records that failed."""
+        provider = AdGuardDNSProvider(
+            url="http://adguard.local", username="admin", password="secret"
+        )
+
+        def mock_post_side_effect(url, json, timeout):
+            if json["domain"] == "bad.example.com":
+                raise requests.exceptions.HTTPError("Server error")
+            return MagicMock()
+
+        with patch.object(provider._session, "post", side_effect=mock_post_side_effect):
+            with patch(
+                "external_dns.cli._shutdown_event.wait", return_value=False
+            ):  # Skip sleep delays
+                results = provider.delete_records(
+                    [("good.example.com", "10.0.0.1"), ("bad.example.com", "10.0.0.2")]
+                )
+
+        assert results == {
+            ("good.example.com", "10.0.0.1"): True,
+            ("bad.example.com", "10.0.0.2"): False,
+        }
+
+    def test_add_records_empty(self) -> None:
+        """Test add_records with no records makes no requests."""
+        provider = AdGuardDNSProvider(url="http://adguard.local", username="", password="")
+
+        with patch.object(provider._session, "post") as mock_post:
+            assert provider.add_records([]) == {}
+            mock_post.assert_not_called()
+
+
 class TestAdGuardAuthentication:
     """Tests for AdGuard authentication functionality."""
 
@@ -208,6 +263,17 @@ class TestAdGuardAuthentication:
         assert provider._auth is None
         assert provider._session.auth is None
 
+    def test_session_connection_pool_sized_to_workers(self) -> None:
+        """Test session mounts a keep-alive pool sized to max_workers."""
+        provider = AdGuardDNSProvider(
+            url="http://adguard.local", username="", password="", max_workers=4
+        )
+
+        for prefix in ("http://", "https://"):
+            adapter = provider._session.get_adapter(f"{prefix}adguard.local")
+            assert adapter._pool_maxsize == 4
+            assert adapter.max_retries.total == 0
+
 
 class TestAdGuardProviderName:
     """Tests for AdGuard provider name property."""
@@ -234,8 +300,22 @@ class TestAdGuardJSONErrorHandling:
 
     def test_get_records_handles_malformed_json_response(self) -> None:
         """Test get_records returns empty list on invalid JSON response."""
-        import json
+        provider = AdGuardDNSProvider(
+            url="http://adguard.local", username="admin", password="secret"
+        )
+
+        with patch.object(provider._session, "get") as mock_get:
+            mock_response = MagicMock()
+            mock_response.raise_for_status = MagicMock()
+            mock_response.content = b"<html>not json</html>"
+            mock_get.return_value = mock_response
+
+            records = provider.get_records()
+
+            assert records == []
 
+    def test_get_records_handles_non_utf8_response(self) -> None:
+        """Test get_records returns empty list when the body is not valid UTF-8."""
         provider = AdGuardDNSProvider(
             url="http://adguard.local", username="admin", password="secret"
         )
@@ -243,7 +323,7 @@ class TestAdGuardJSONErrorHandling:
         with patch.object(provider._session, "get") as mock_get:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.side_effect = json.JSONDecodeError("Invalid", "", 0)
+            mock_response.content = b'["\xff"]'
             mock_get.return_value = mock_response
 
             records = provider.get_records()
@@ -266,7 +346,7 @@ class TestAdGuardJSONErrorHandling:
         with patch.object(provider._session, "get") as mock_get:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = mock_response_data
+            mock_response.content = json.dumps(mock_response_data).encode()
             mock_get.return_value = mock_response
 
             records = provider.get_records()
@@ -295,7 +375,7 @@ class TestAdGuardJSONErrorHandling:
         with patch.object(provider._session, "get") as mock_get:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = mock_response_data
+            mock_response.content = json.dumps(mock_response_data).encode()
             mock_get.return_value = mock_response
 
             records = provider.get_records()
@@ -325,7 +405,9 @@ class TestAdGuardRetryBehavior:
             return mock_response
 
         with patch.object(provider._session, "get", side_effect=mock_get_side_effect):
-            with patch("external_dns.cli.time.sleep"):  # Skip sleep delays
+            with patch(
+                "external_dns.cli._shutdown_event.wait", return_value=False
+            ):  # Skip sleep delays
                 result = provider.test_connection()
 
         assert result is True
@@ -347,11 +429,13 @@ class TestAdGuardRetryBehavior:
                 raise requests.exceptions.ConnectionError("Connection refused")
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = mock_response_data
+            mock_response.content = json.dumps(mock_response_data).encode()
             return mock_response
 
         with patch.object(provider._session, "get", side_effect=mock_get_side_effect):
-            with patch("external_dns.cli.time.sleep"):  # Skip sleep delays
+            with patch(
+                "external_dns.cli._shutdown_event.wait", return_value=False
+            ):  # Skip sleep delays
                 records = provider.get_records()
 
         assert len(records) == 1
@@ -376,7 +460,9 @@ class TestAdGuardRetryBehavior:
             return mock_response
 
         with patch.object(provider._session, "post", side_effect=mock_post_side_effect):
-            with patch("external_dns.cli.time.sleep"):  # Skip sleep delays
+            with patch(
+                "external_dns.cli._shutdown_event.wait", return_value=False
+            ):  # Skip sleep delays
                 result = provider.add_record("app.example.com", "10.0.0.1")
 
         assert result is True
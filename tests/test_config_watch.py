@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from external_dns.cli import find_config_files
+from external_dns.cli import find_config_files, snapshot_config_files
 
 
 def test_find_config_files_directory_excludes_template(tmp_path: Path) -> None:
@@ -10,3 +10,21 @@ def test_find_config_files_directory_excludes_template(tmp_path: Path) -> None:
 
     files = find_config_files(str(tmp_path))
     assert [Path(f).name for f in files] == ["a.yaml", "c.yaml"]
+
+
+def test_snapshot_config_files_detects_add_remove_and_modify(tmp_path: Path) -> None:
+    (tmp_path / "a.yaml").write_text("instances: []\n", encoding="utf-8")
+    before = snapshot_config_files(str(tmp_path))
+    assert list(before) == [str(tmp_path / "a.yaml")]
+    assert snapshot_config_files(str(tmp_path)) == before
+
+    (tmp_path / "a.yaml").write_text("instances: [1]\n", encoding="utf-8")
+    (tmp_path / "b.yaml").write_text("instances: []\n", encoding="utf-8")
+    after = snapshot_config_files(str(tmp_path))
+
+    assert after.keys() - before.keys() == {str(tmp_path / "b.yaml")}
+    assert after[str(tmp_path / "a.yaml")] != before[str(tmp_path / "a.yaml")]
+
+
+def test_snapshot_config_files_missing_path_is_empty(tmp_path: Path) -> None:
+    assert snapshot_config_files(str(tmp_path / "missing.yaml")) == {}
@@ -1,7 +1,9 @@
 """Unit tests for StateStore."""
 
 import json
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 from external_dns.cli import StateStore
 
@@ -75,6 +77,112 @@ class TestStateStoreSave:
         parsed = json.loads(content)
         assert parsed == state
 
+    def test_save_writes_sorted_compact_json(self, tmp_path: Path) -> None:
+        """Test save output is key-sorted single-line JSON by default."""
+        state_file = tmp_path / "state.json"
+        store = StateStore(str(state_file))
+
+        store.save({"version": 1, "domains": {}, "instances": {"b": {}, "a": {}}})
+
+        content = state_file.read_text()
+        assert content == json.dumps(
+            {"version": 1, "domains": {}, "instances": {"b": {}, "a": {}}},
+            separators=(",", ":"),
+            sort_keys=True,
+        )
+
+    def test_save_writes_sorted_indented_json_when_pretty(self, tmp_path: Path) -> None:
+        """Test pretty output is key-sorted and indented for readable diffs."""
+        state_file = tmp_path / "state.json"
+        store = StateStore(str(state_file), pretty=True)
+
+        store.save({"version": 1, "domains": {}, "instances": {"b": {}, "a": {}}})
+
+        content = state_file.read_text()
+        assert content == json.dumps(
+            {"version": 1, "domains": {}, "instances": {"b": {}, "a": {}}},
+            indent=2,
+            sort_keys=True,
+        )
+
+    def test_save_writes_sets_as_sorted_lists(self, tmp_path: Path) -> None:
+        """Test in-memory answer sets are persisted as sorted JSON lists."""
+        state_file = tmp_path / "state.json"
+        store = StateStore(str(state_file))
+
+        store.save({"managed_records": {"app.example.com": {"10.0.0.2", "10.0.0.1"}}})
+
+        content = json.loads(state_file.read_text())
+        assert content["managed_records"] == {"app.example.com": ["10.0.0.1", "10.0.0.2"]}
+
+    def test_save_skips_rewrite_when_state_unchanged(self, tmp_path: Path) -> None:
+        """Test save does not rewrite the file when the state is unchanged."""
+        state_file = tmp_path / "state.json"
+        store = StateStore(str(state_file))
+        state = {"version": 1, "instances": {}, "domains": {}}
+
+        store.save(state)
+        first_mtime = state_file.stat().st_mtime_ns
+        with patch.object(Path, "replace") as mock_replace:
+            store.save(dict(state))
+            mock_replace.assert_not_called()
+        assert state_file.stat().st_mtime_ns == first_mtime
+
+        state["domains"]["app.example.com"] = {}
+        store.save(state)
+        assert json.loads(state_file.read_text()) == state
+
+    def test_save_defers_timestamp_only_changes(self, tmp_path: Path) -> None:
+        """Test poll timestamps alone are only flushed after the flush interval."""
+        state_file = tmp_path / "state.json"
+        store = StateStore(str(state_file), timestamp_flush_seconds=60)
+        state = {
+            "version": 1,
+            "instances": {"core": {"last_success": 100, "last_error": "", "url": "u"}},
+            "domains": {"a.example.com": {"sources": {"core": {"answer": "1", "last_seen": 100}}}},
+        }
+        store.save(state)
+
+        state["instances"]["core"]["last_success"] = 160
+        state["domains"]["a.example.com"]["sources"]["core"]["last_seen"] = 160
+        store.save(state)
+        assert json.loads(state_file.read_text())["instances"]["core"]["last_success"] == 100
+
+        with patch("external_dns.cli.time.time", return_value=time.time() + 61):
+            store.save(state)
+        assert json.loads(state_file.read_text())["instances"]["core"]["last_success"] == 160
+
+    def test_load_returns_deferred_timestamps(self, tmp_path: Path) -> None:
+        """Test load serves a deferred save so callers never see older timestamps."""
+        state_file = tmp_path / "state.json"
+        store = StateStore(str(state_file), timestamp_flush_seconds=60)
+        state = {
+            "version": 1,
+            "instances": {"core": {"last_success": 100, "last_error": "", "url": "u"}},
+            "domains": {},
+        }
+        store.save(state)
+        state["instances"]["core"]["last_success"] = 160
+        store.save(state)
+
+        assert json.loads(state_file.read_text())["instances"]["core"]["last_success"] == 100
+        assert store.load()["instances"]["core"]["last_success"] == 160
+
+        store.flush()
+        assert json.loads(state_file.read_text())["instances"]["core"]["last_success"] == 160
+        assert StateStore(str(state_file)).load() == store.load()
+
+    def test_load_seeds_digest_so_unchanged_state_is_not_rewritten(self, tmp_path: Path) -> None:
+        """Test a fresh store does not rewrite a state file it just loaded unchanged."""
+        state_file = tmp_path / "state.json"
+        StateStore(str(state_file)).save({"version": 1, "instances": {}, "domains": {}})
+
+        store = StateStore(str(state_file))
+        state = store.load()
+        with patch.object(Path, "replace") as mock_replace:
+            store.save(state)
+            mock_replace.assert_not_called()
+
     def test_save_atomic_via_temp_file(self, tmp_path: Path) -> None:
         """Test save uses temp file + rename for atomic writes."""
         state_file = tmp_path / "state.json"
@@ -93,6 +201,28 @@ class TestStateStoreSave:
         content = json.loads(state_file.read_text())
         assert content == state
 
+    def test_save_fsyncs_file_and_directory(self, tmp_path: Path) -> None:
+        """Test a changed save syncs the temp file and the directory; unchanged saves do not."""
+        state_file = tmp_path / "state.json"
+        store = StateStore(str(state_file))
+        state = {"version": 1, "instances": {}, "domains": {}}
+
+        with patch("external_dns.cli.os.fsync") as mock_fsync:
+            store.save(state)
+            assert mock_fsync.call_count == 2
+            store.save(state)
+            assert mock_fsync.call_count == 2
+
+    def test_save_without_fsync(self, tmp_path: Path) -> None:
+        """Test fsync can be disabled for ephemeral state."""
+        state_file = tmp_path / "state.json"
+        store = StateStore(str(state_file), fsync=False)
+
+        with patch("external_dns.cli.os.fsync") as mock_fsync:
+            store.save({"version": 1, "instances": {}, "domains": {}})
+        mock_fsync.assert_not_called()
+        assert json.loads(state_file.read_text())["version"] == 1
+
     def test_save_overwrites_existing_file(self, tmp_path: Path) -> None:
         """Test save overwrites existing file content."""
         state_file = tmp_path / "state.json"
@@ -138,9 +268,9 @@ class TestStateStorePath:
         assert store.path == state_file
 
     def test_save_formats_json_with_indentation(self, tmp_path: Path) -> None:
-        """Test saved JSON is formatted with indentation for readability."""
+        """Test saved JSON is formatted with indentation when pretty output is enabled."""
         state_file = tmp_path / "state.json"
-        store = StateStore(str(state_file))
+        store = StateStore(str(state_file), pretty=True)
         state = {"version": 1, "instances": {}, "domains": {}}
 
         store.save(state)
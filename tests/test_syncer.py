@@ -4,9 +4,13 @@ Tests the core sync algorithm that determines what DNS records to add/update/del
 ensuring correctness of the reconciliation logic.
 """
 
+import json
 import re
+import threading
+import time
 from pathlib import Path
 from typing import Dict, List, Set
+from unittest.mock import MagicMock, patch
 
 from external_dns.cli import (
     DNSProvider,
@@ -17,6 +21,7 @@ from external_dns.cli import (
     ProxyRoute,
     ReverseProxyProvider,
     StateStore,
+    TraefikProxyProvider,
 )
 
 # =============================================================================
@@ -265,6 +270,141 @@ def test_sync_uses_first_instance_ip_for_conflicting_domains(tmp_path: Path) ->
     assert records.get("app.example.com") == "10.0.0.1"
 
 
+def test_sync_refreshes_existing_source_entry_in_place(tmp_path: Path) -> None:
+    """A re-polled domain updates its stored source entry rather than replacing it."""
+    instances = [make_instance("core", "10.0.0.2")]
+    routes = {"core": [make_route("app.example.com", "10.0.0.2")]}
+    syncer, _, _ = create_test_syncer(tmp_path, proxy_instances=instances, proxy_routes=routes)
+    syncer.state_store.save(
+        {
+            "version": 1,
+            "instances": {},
+            "domains": {
+                "app.example.com": {"sources": {"core": {"answer": "10.0.0.1", "last_seen": 0}}}
+            },
+            "managed_records": {},
+        }
+    )
+
+    syncer.sync_once()
+
+    source = syncer.state_store.load()["domains"]["app.example.com"]["sources"]["core"]
+    assert source["answer"] == "10.0.0.2"
+    assert source["last_seen"] > 0
+
+
+def test_sync_picks_answer_by_configured_instance_order(tmp_path: Path) -> None:
+    """Answer comes from the earliest configured instance, not state/source order."""
+    instances = [make_instance("core", "10.0.0.1"), make_instance("edge", "10.0.0.2")]
+    routes = {"edge": [make_route("app.example.com", "10.0.0.2")]}
+    syncer, dns, _ = create_test_syncer(
+        tmp_path, proxy_instances=instances, proxy_routes=routes, failing_instances={"core"}
+    )
+    syncer.state_store.save(
+        {
+            "version": 1,
+            "instances": {},
+            "domains": {
+                "app.example.com": {
+                    "sources": {
+                        "gone": {"answer": "10.0.0.9", "last_seen": 0},
+                        "edge": {"answer": "10.0.0.2", "last_seen": 0},
+                        "core": {"answer": "10.0.0.1", "last_seen": 0},
+                    }
+                }
+            },
+            "managed_records": {},
+        }
+    )
+
+    syncer.sync_once()
+
+    records = {r.domain: r.answer for r in dns.get_records()}
+    assert records.get("app.example.com") == "10.0.0.1"
+
+
+def test_sync_skips_reconcile_while_routes_unchanged(tmp_path: Path) -> None:
+    """With a resync interval, unchanged polls skip the DNS fetch and reconcile."""
+    instances = [make_instance("core", "10.0.0.1")]
+    routes = {"core": [make_route("app.example.com", "10.0.0.1")]}
+    syncer, dns, _ = create_test_syncer(tmp_path, proxy_instances=instances, proxy_routes=routes)
+    syncer.resync_interval = 3600
+    fetches: List[int] = []
+    get_records = dns.get_records
+
+    def counting_get_records() -> List[DNSRecord]:
+        fetches.append(1)
+        return get_records()
+
+    dns.get_records = counting_get_records  # type: ignore[method-assign]
+
+    syncer.sync_once()
+    syncer.sync_once()
+    assert len(fetches) == 1
+
+    # A route change forces a full reconcile again
+    routes["core"].append(make_route("new.example.com", "10.0.0.1"))
+    syncer.sync_once()
+    assert len(fetches) == 2
+    assert ("new.example.com", "10.0.0.1") in dns.add_calls
+
+    # So does the resync interval elapsing
+    syncer.resync_interval = 0
+    syncer.sync_once()
+    assert len(fetches) == 3
+
+
+def test_sync_warns_only_when_instance_answers_differ(tmp_path: Path, caplog) -> None:
+    """Conflict warning fires for disagreeing instances but not for agreeing ones."""
+    instances = [make_instance("core", "10.0.0.1"), make_instance("edge", "10.0.0.2")]
+    routes = {
+        "core": [
+            make_route("app.example.com", "10.0.0.1"),
+            make_route("same.example.com", "10.0.0.9"),
+        ],
+        "edge": [
+            make_route("app.example.com", "10.0.0.2"),
+            make_route("same.example.com", "10.0.0.9"),
+        ],
+    }
+    syncer, _, _ = create_test_syncer(tmp_path, proxy_instances=instances, proxy_routes=routes)
+
+    with caplog.at_level("WARNING", logger="external_dns.cli"):
+        syncer.sync_once()
+
+    conflicts = [r.getMessage() for r in caplog.records if "different target IPs" in r.getMessage()]
+    assert len(conflicts) == 1
+    assert "app.example.com" in conflicts[0]
+    assert "['10.0.0.1', '10.0.0.2']" in conflicts[0]
+
+
+def test_sync_fetches_instance_routes_concurrently(tmp_path: Path) -> None:
+    """Routes from all instances are fetched in parallel, then applied in configured order."""
+    instances = [make_instance("core", "10.0.0.1"), make_instance("edge", "10.0.0.2")]
+    routes = {
+        "core": [make_route("app.example.com", "10.0.0.1")],
+        "edge": [make_route("app.example.com", "10.0.0.2")],
+    }
+    syncer, dns, proxy = create_test_syncer(
+        tmp_path, proxy_instances=instances, proxy_routes=routes
+    )
+
+    # Both fetches must be in flight at once for the barrier to release.
+    barrier = threading.Barrier(2, timeout=5)
+    fetch = proxy.get_routes
+
+    def get_routes_together(instance: ProxyInstance) -> List[ProxyRoute]:
+        barrier.wait()
+        return fetch(instance)
+
+    proxy.get_routes = get_routes_together  # type: ignore[method-assign]
+
+    syncer.sync_once()
+
+    records = {r.domain: r.answer for r in dns.get_records()}
+    assert records.get("app.example.com") == "10.0.0.1"
+
+
 def test_sync_preserves_record_when_one_instance_fails(tmp_path: Path) -> None:
     """Instance unreachable should preserve records from that instance (not delete)."""
     initial_records = [DNSRecord("app.example.com", "10.0.0.1")]
@@ -301,6 +441,45 @@ def test_sync_preserves_record_when_one_instance_fails(tmp_path: Path) -> None:
     assert records.get("app.example.com") == "10.0.0.1"
 
 
+def test_sync_continues_when_one_instance_returns_invalid_json(tmp_path: Path) -> None:
+    """A non-JSON body from one Traefik instance should not abort the other instances."""
+    proxy = TraefikProxyProvider(
+        instances_json=json.dumps(
+            [
+                {"name": "broken", "url": "http://broken:8080", "target_ip": "10.0.0.1"},
+                {"name": "core", "url": "http://core:8080", "target_ip": "10.0.0.2"},
+            ]
+        )
+    )
+    dns = MockDNSProvider()
+    state_store = StateStore(str(tmp_path / "state.json"))
+    syncer = ExternalDNSSyncer(
+        dns_provider=dns,
+        proxy_provider=proxy,
+        state_store=state_store,
+        static_rewrites={},
+        exclude_patterns=[],
+    )
+
+    def fake_get(url: str, **kwargs) -> MagicMock:
+        response = MagicMock()
+        if url.startswith("http://broken"):
+            response.content = b"<html>bad gateway</html>"
+        else:
+            response.content = json.dumps(
+                [{"name": "app@docker", "rule": "Host(`app.example.com`)"}]
+            ).encode()
+        return response
+
+    with patch.object(proxy._session, "get", side_effect=fake_get):
+        syncer.sync_once()
+
+    assert dns.add_calls == [("app.example.com", "10.0.0.2")]
+    instances = state_store.load()["instances"]
+    assert "Invalid JSON" in instances["broken"]["last_error"]
+    assert instances["core"]["last_error"] == ""
+
+
 def test_sync_removes_orphaned_records_when_instance_removed(tmp_path: Path) -> None:
     """Instance removed from config should clean up its managed DNS records."""
     initial_records = [DNSRecord("app.example.com", "10.0.0.1")]
@@ -362,6 +541,32 @@ def test_sync_excludes_domains_matching_exact_pattern(tmp_path: Path) -> None:
     assert "auth.example.com" not in records
 
 
+def test_sync_applies_exclusions_updated_after_reload(tmp_path: Path) -> None:
+    """Exclusion patterns swapped in via set_exclude_patterns take effect next sync."""
+    instances = [make_instance("core")]
+    routes = {"core": [make_route("auth.example.com", "10.0.0.1")]}
+
+    syncer, dns, _ = create_test_syncer(tmp_path, proxy_instances=instances, proxy_routes=routes)
+    syncer.set_exclude_patterns([re.compile(r"^auth\.example\.com$")])
+
+    syncer.sync_once()
+
+    assert len(dns.add_calls) == 0
+
+
+def test_sync_exclusion_cache_resets_when_patterns_change(tmp_path: Path) -> None:
+    """Cached exclusion results do not survive a change of patterns."""
+    syncer, _, _ = create_test_syncer(
+        tmp_path, exclude_patterns=[re.compile(r"^auth\.example\.com$")]
+    )
+    assert syncer._is_excluded("auth.example.com") is True
+    assert syncer._is_excluded("auth.example.com") is True
+
+    syncer.set_exclude_patterns([re.compile(r"^other\.example\.com$")])
+
+    assert syncer._is_excluded("auth.example.com") is False
+
+
 def test_sync_excludes_domains_matching_wildcard_pattern(tmp_path: Path) -> None:
     """Wildcard exclusion should prevent matching domains from syncing."""
     instances = [make_instance("core")]
@@ -496,6 +701,35 @@ def test_sync_only_syncs_internal_zone_domains(tmp_path: Path) -> None:
 # =============================================================================
 
 
+def test_sync_fetches_dns_records_once_per_cycle(tmp_path: Path) -> None:
+    """One get_records call serves static rewrites and route reconciliation."""
+    instances = [make_instance("core")]
+    routes = {"core": [make_route("app.example.com", "10.0.0.1")]}
+    static_rewrites = {"app.example.com": "10.0.0.1"}
+
+    syncer, dns, _ = create_test_syncer(
+        tmp_path,
+        proxy_instances=instances,
+        proxy_routes=routes,
+        static_rewrites=static_rewrites,
+    )
+    fetches = 0
+    get_records = dns.get_records
+
+    def counting_get_records() -> List[DNSRecord]:
+        nonlocal fetches
+        fetches += 1
+        return get_records()
+
+    dns.get_records = counting_get_records  # type: ignore[method-assign]
+
+    syncer.sync_once()
+
+    assert fetches == 1
+    # The static rewrite's add is visible to route reconciliation without a re-fetch
+    assert dns.add_calls == [("app.example.com", "10.0.0.1")]
+
+
 def test_sync_adds_missing_static_rewrite(tmp_path: Path) -> None:
     """Static rewrite not in DNS should be added."""
     instances = [make_instance("core")]
@@ -653,6 +887,49 @@ def test_sync_handles_duplicate_dns_records(tmp_path: Path) -> None:
     assert ("app.example.com", "10.0.0.3") in dns_provider.add_calls
 
 
+def test_sync_keeps_correct_record_when_consolidating_managed(tmp_path: Path) -> None:
+    """A managed record already holding the desired answer is kept, not re-added."""
+    instances = [make_instance("core")]
+    routes = {"core": [make_route("app.example.com", "10.0.0.1")]}
+    syncer, dns, _ = create_test_syncer(tmp_path, proxy_instances=instances, proxy_routes=routes)
+
+    def get_records_with_duplicates() -> List[DNSRecord]:
+        return [
+            DNSRecord("app.example.com", "10.0.0.1"),
+            DNSRecord("app.example.com", "10.0.0.2"),
+        ]
+
+    dns.get_records = get_records_with_duplicates  # type: ignore[method-assign]
+    syncer.state_store.save(
+        {
+            "version": 1,
+            "instances": {},
+            "domains": {},
+            "managed_records": {"app.example.com": ["10.0.0.1", "10.0.0.2"]},
+        }
+    )
+
+    syncer.sync_once()
+
+    assert dns.delete_calls == [("app.example.com", "10.0.0.2")]
+    assert dns.add_calls == []
+    assert syncer.state_store.load()["managed_records"] == {"app.example.com": ["10.0.0.1"]}
+
+
+def test_plan_record_changes_makes_no_provider_calls(tmp_path: Path) -> None:
+    """Planning only computes changes; nothing reaches the DNS provider."""
+    syncer, dns, _ = create_test_syncer(tmp_path)
+    state = {"version": 1, "instances": {}, "domains": {}, "managed_records": {}}
+
+    plan = syncer._plan_record_changes(
+        state, {"app.example.com": "10.0.0.1"}, {"old.example.com": ["10.0.0.9"]}, []
+    )
+
+    assert plan.adds == [("app.example.com", "10.0.0.1")]
+    assert plan.deletes == []
+    assert dns.add_calls == [] and dns.delete_calls == []
+
+
 def test_sync_idempotent_on_repeated_calls(tmp_path: Path) -> None:
     """Same state synced twice should result in no changes second time."""
     instances = [make_instance("core")]
@@ -708,6 +985,62 @@ def test_sync_handles_multiple_domains_from_single_instance(tmp_path: Path) -> N
     assert records.get("app3.example.com") == "10.0.0.1"
 
 
+def test_sync_applies_changes_in_sorted_domain_order(tmp_path: Path) -> None:
+    """Records are written in domain order regardless of route discovery order."""
+    instances = [make_instance("core")]
+    routes = {
+        "core": [
+            make_route("zeta.example.com", "10.0.0.1"),
+            make_route("alpha.example.com", "10.0.0.1"),
+            make_route("mid.example.com", "10.0.0.1"),
+        ]
+    }
+
+    syncer, dns, _ = create_test_syncer(tmp_path, proxy_instances=instances, proxy_routes=routes)
+
+    syncer.sync_once()
+
+    assert [domain for domain, _ in dns.add_calls] == [
+        "alpha.example.com",
+        "mid.example.com",
+        "zeta.example.com",
+    ]
+
+
+def test_sync_batches_dns_writes_deletes_before_adds(tmp_path: Path) -> None:
+    """Record changes go to the provider as one delete batch followed by one add batch."""
+    instances = [make_instance("core")]
+    routes = {"core": [make_route("app.example.com", "10.0.0.2")]}
+    initial_records = [DNSRecord(domain="app.example.com", answer="10.0.0.1")]
+
+    syncer, dns, _ = create_test_syncer(
+        tmp_path, dns_records=initial_records, proxy_instances=instances, proxy_routes=routes
+    )
+    syncer.state_store.save({"managed_records": {"app.example.com": ["10.0.0.1"]}})
+
+    batches: List[tuple[str, List[tuple[str, str]]]] = []
+    add_records, delete_records = dns.add_records, dns.delete_records
+
+    def record_adds(records):  # type: ignore[no-untyped-def]
+        batches.append(("add", list(records)))
+        return add_records(records)
+
+    def record_deletes(records):  # type: ignore[no-untyped-def]
+        batches.append(("delete", list(records)))
+        return delete_records(records)
+
+    dns.add_records = record_adds  # type: ignore[method-assign]
+    dns.delete_records = record_deletes  # type: ignore[method-assign]
+
+    syncer.sync_once()
+
+    assert batches == [
+        ("delete", [("app.example.com", "10.0.0.1")]),
+        ("add", [("app.example.com", "10.0.0.2")]),
+    ]
+    assert {r.domain: r.answer for r in dns.get_records()} == {"app.example.com": "10.0.0.2"}
+
+
 # =============================================================================
 # Graceful Degradation Tests
 # =============================================================================
@@ -841,6 +1174,32 @@ def test_sync_recovers_after_transient_failure(tmp_path: Path) -> None:
     assert records.get("app.example.com") == "10.0.0.1"
 
 
+def test_sync_carries_forward_deferred_last_success(tmp_path: Path) -> None:
+    """A failure within the state flush window should keep the previous cycle's last_success."""
+    state_path = tmp_path / "state.json"
+    syncer, _, proxy = create_test_syncer(
+        tmp_path,
+        proxy_instances=[make_instance("core", "10.0.0.1")],
+        proxy_routes={"core": [make_route("app.example.com", "10.0.0.1")]},
+    )
+    start = time.time()
+    with patch("external_dns.cli.time.time", return_value=start):
+        syncer.sync_once()
+
+    # Only timestamps change on the next cycle, so its save is deferred
+    with patch("external_dns.cli.time.time", return_value=start + 10):
+        syncer.sync_once()
+    assert json.loads(state_path.read_text())["instances"]["core"]["last_success"] == int(start)
+
+    proxy._failing_instances.add("core")
+    with patch("external_dns.cli.time.time", return_value=start + 20):
+        syncer.sync_once()
+
+    saved = json.loads(state_path.read_text())["instances"]["core"]
+    assert saved["last_error"]
+    assert saved["last_success"] == int(start + 10)
+
+
 def test_sync_state_not_corrupted_on_partial_failure(tmp_path: Path) -> None:
     """Partial failures should not corrupt state file."""
     instances = [make_instance("core", "10.0.0.1"), make_instance("edge", "10.0.0.2")]
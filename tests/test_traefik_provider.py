@@ -1,13 +1,22 @@
 """Unit tests for TraefikProxyProvider."""
 
+import fnmatch
 import json
+import re
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
 
-from external_dns.cli import DNSZone, ProxyInstance, TraefikProxyProvider
+from external_dns.cli import (
+    DNSZone,
+    ProxyInstance,
+    TraefikProxyProvider,
+    _compile_wildcard,
+    _parse_host_rule,
+    _wildcard_matcher,
+)
 
 
 class TestTraefikInstanceLoadingFromYaml:
@@ -68,6 +77,24 @@ sources:
         assert len(instances) == 1
         assert instances[0].name == "valid"
 
+    def test_get_instances_reuses_built_instances_until_file_changes(self, tmp_path: Path) -> None:
+        """Unchanged config files reuse their ProxyInstance objects across polls."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "sources:\n  - {name: core, url: http://a:8080, target_ip: 10.0.0.2}\n"
+        )
+        provider = TraefikProxyProvider(config_path=str(config_file))
+
+        first = provider.get_instances()
+        with patch.object(provider, "_instance_from_dict") as build:
+            assert provider.get_instances()[0] is first[0]
+        build.assert_not_called()
+
+        config_file.write_text(
+            "sources:\n  - {name: edge, url: http://b:8080, target_ip: 10.0.0.33}\n"
+        )
+        assert [i.name for i in provider.get_instances()] == ["edge"]
+
 
 class TestTraefikInstanceLoadingFromJson:
     """Tests for Traefik instance loading from JSON environment variable."""
@@ -98,6 +125,26 @@ class TestTraefikInstanceLoadingFromJson:
         assert instances[1].name == "edge"
         assert instances[1].verify_tls is False
 
+    def test_get_instances_from_json_skips_incomplete_entries(self) -> None:
+        """Test entries without url/target_ip are skipped and internal_ip is accepted."""
+        json_config = json.dumps(
+            [
+                "not-a-dict",
+                {"name": "no-ip", "url": "http://traefik:8080"},
+                {"name": "legacy", "url": "http://traefik:8080", "internal_ip": "10.0.0.4"},
+            ]
+        )
+
+        provider = TraefikProxyProvider(
+            config_path="/nonexistent/path.yaml",
+            instances_json=json_config,
+        )
+        instances = provider.get_instances()
+
+        assert [i.name for i in instances] == ["legacy"]
+        assert instances[0].target_ip == "10.0.0.4"
+        assert instances[0].type == "traefik"
+
 
 class TestTraefikInstanceSingleFallback:
     """Tests for Traefik single-instance fallback mode."""
@@ -145,7 +192,7 @@ class TestTraefikRouteDiscovery:
         with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = mock_routers
+            mock_response.content = json.dumps(mock_routers).encode()
             mock_get.return_value = mock_response
 
             routes = provider.get_routes(instance)
@@ -169,7 +216,7 @@ class TestTraefikRouteDiscovery:
         with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = mock_routers
+            mock_response.content = json.dumps(mock_routers).encode()
             mock_get.return_value = mock_response
 
             routes = provider.get_routes(instance)
@@ -212,7 +259,7 @@ class TestTraefikRouterFilter:
         with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = mock_routers
+            mock_response.content = json.dumps(mock_routers).encode()
             mock_get.return_value = mock_response
 
             routes = provider.get_routes(instance)
@@ -239,7 +286,7 @@ class TestTraefikRouterFilter:
         with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = mock_routers
+            mock_response.content = json.dumps(mock_routers).encode()
             mock_get.return_value = mock_response
 
             routes = provider.get_routes(instance)
@@ -280,7 +327,7 @@ class TestTraefikMiddlewareFilter:
         with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = mock_routers
+            mock_response.content = json.dumps(mock_routers).encode()
             mock_get.return_value = mock_response
 
             routes = provider.get_routes(instance)
@@ -304,7 +351,7 @@ class TestTraefikZoneDetection:
         with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = mock_routers
+            mock_response.content = json.dumps(mock_routers).encode()
             mock_get.return_value = mock_response
 
             routes = provider.get_routes(instance)
@@ -324,7 +371,7 @@ class TestTraefikZoneDetection:
         with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = mock_routers
+            mock_response.content = json.dumps(mock_routers).encode()
             mock_get.return_value = mock_response
 
             routes = provider.get_routes(instance)
@@ -344,7 +391,7 @@ class TestTraefikZoneDetection:
         with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = mock_routers
+            mock_response.content = json.dumps(mock_routers).encode()
             mock_get.return_value = mock_response
 
             routes = provider.get_routes(instance)
@@ -364,7 +411,7 @@ class TestTraefikZoneDetection:
         with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = mock_routers
+            mock_response.content = json.dumps(mock_routers).encode()
             mock_get.return_value = mock_response
 
             routes = provider.get_routes(instance)
@@ -372,6 +419,28 @@ class TestTraefikZoneDetection:
             assert len(routes) == 1
             assert routes[0].zone == DNSZone.EXTERNAL
 
+    def test_detect_zone_agrees_with_suffix_regex(self) -> None:
+        """Test suffix detection matches the -(internal|external)(@|end) grammar."""
+        zone_suffix_re = re.compile(r"-(internal|external)(?:@|$)", re.IGNORECASE)
+        provider = TraefikProxyProvider(default_zone="internal")
+        names = [
+            "app-internal@docker",
+            "APP-EXTERNAL@docker",
+            "app-external",
+            "app-internal-v2@docker",
+            "app-external@x-internal",
+            "internal@docker",
+            "app@docker-external",
+            "app-externals@docker",
+            "",
+        ]
+        for name in names:
+            match = zone_suffix_re.search(name)
+            expected = DNSZone.INTERNAL
+            if match and match.group(1).lower() == "external":
+                expected = DNSZone.EXTERNAL
+            assert provider._detect_zone(name, {}) == expected, name
+
 
 class TestTraefikProviderName:
     """Tests for Traefik provider name property."""
@@ -411,6 +480,29 @@ class TestTraefikHostnameExtraction:
         )
         assert sorted(hostnames) == ["app1.example.com", "app2.example.com"]
 
+    def test_extract_hostnames_without_host_matcher(self) -> None:
+        """Test rules without a Host() matcher yield no hostnames."""
+        provider = TraefikProxyProvider()
+        assert provider._extract_hostnames("PathPrefix(`/api`)") == []
+
+    def test_extract_hostnames_deduplicates(self) -> None:
+        """Test repeated hostnames in a rule are returned once, in first-seen order."""
+        provider = TraefikProxyProvider()
+        hostnames = provider._extract_hostnames(
+            "(Host(`b.example.com`) && Path(`/x`)) || Host(`a.example.com`) || Host(`b.example.com`)"
+        )
+        assert hostnames == ["b.example.com", "a.example.com"]
+
+    def test_extract_hostnames_memoizes_rule_parse(self) -> None:
+        """Test identical rules reuse the cached parse across calls."""
+        provider = TraefikProxyProvider()
+        rule = "Host(`cached.example.com`) && PathPrefix(`/`)"
+        _parse_host_rule.cache_clear()
+
+        provider._extract_hostnames(rule)
+        assert provider._extract_hostnames(rule) == ["cached.example.com"]
+        assert _parse_host_rule.cache_info().hits == 1
+
     def test_extract_hostnames_empty_rule(self) -> None:
         """Test extracting from empty rule returns empty list."""
         provider = TraefikProxyProvider()
@@ -432,6 +524,34 @@ class TestTraefikFilterMethods:
         provider = TraefikProxyProvider()
         assert provider._matches_filter("anything@docker", "") is True
 
+    def test_matches_filter_reuses_compiled_pattern(self) -> None:
+        """Test wildcard patterns are compiled once and cached."""
+        assert _compile_wildcard("app-*") is _compile_wildcard("app-*")
+        assert _compile_wildcard("app-*").match("app-web@docker") is not None
+
+    def test_wildcard_matcher_agrees_with_fnmatch(self) -> None:
+        """Test str-method fast paths match fnmatch semantics for each pattern shape."""
+        patterns = [
+            "app-web@docker",
+            "app-*",
+            "*-internal",
+            "*-internal*",
+            "app-?eb*",
+            "*",
+            "[ab]*",
+        ]
+        names = ["app-web@docker", "app-web-internal", "bpp-internal", "app-", "x", ""]
+        for pattern in patterns:
+            matcher = _wildcard_matcher(pattern)
+            for name in names:
+                assert matcher(name) == fnmatch.fnmatchcase(name, pattern), (pattern, name)
+
+    def test_has_middleware_is_case_insensitive(self) -> None:
+        """Test _has_middleware ignores case on both sides."""
+        provider = TraefikProxyProvider()
+        router = {"middlewares": ["Auth@docker"]}
+        assert provider._has_middleware(router, "AUTH") is True
+
     def test_has_middleware_returns_true_when_present(self) -> None:
         """Test _has_middleware returns True when middleware is present."""
         provider = TraefikProxyProvider()
@@ -455,19 +575,21 @@ class TestTraefikJSONErrorHandling:
     """Tests for Traefik JSON error handling."""
 
     def test_get_routes_handles_invalid_json(self) -> None:
-        """Test get_routes raises exception on malformed JSON response."""
+        """Test get_routes raises a RequestException on malformed JSON response."""
         provider = TraefikProxyProvider()
         instance = ProxyInstance(name="test", url="http://traefik:8080", target_ip="10.0.0.1")
 
         with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.side_effect = json.JSONDecodeError("Invalid", "", 0)
+            mock_response.content = b"<html>not json</html>"
             mock_get.return_value = mock_response
 
-            with pytest.raises(json.JSONDecodeError):
+            with pytest.raises(requests.exceptions.InvalidJSONError) as excinfo:
                 provider.get_routes(instance)
 
+            assert isinstance(excinfo.value.__cause__, ValueError)
+
     def test_get_routes_handles_non_list_response(self) -> None:
         """Test get_routes returns empty list if response is not a list."""
         provider = TraefikProxyProvider()
@@ -477,7 +599,7 @@ class TestTraefikJSONErrorHandling:
         with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = {"routers": []}  # Dict, not list
+            mock_response.content = json.dumps({"routers": []}).encode()  # Dict, not list
             mock_get.return_value = mock_response
 
             routes = provider.get_routes(instance)
@@ -499,7 +621,7 @@ class TestTraefikJSONErrorHandling:
         with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = mock_routers
+            mock_response.content = json.dumps(mock_routers).encode()
             mock_get.return_value = mock_response
 
             routes = provider.get_routes(instance)
@@ -528,13 +650,123 @@ class TestTraefikRetryBehavior:
                 raise requests.exceptions.ConnectionError("Connection refused")
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
-            mock_response.json.return_value = mock_routers
+            mock_response.content = json.dumps(mock_routers).encode()
             return mock_response
 
         with patch("requests.Session.get", side_effect=mock_get_side_effect):
-            with patch("external_dns.cli.time.sleep"):  # Skip sleep delays
+            with patch(
+                "external_dns.cli._shutdown_event.wait", return_value=False
+            ):  # Skip sleep delays
                 routes = provider.get_routes(instance)
 
         assert len(routes) == 1
         assert routes[0].hostname == "app.example.com"
         assert call_count == 2  # First failed, second succeeded
+
+
+class TestTraefikSessionReuse:
+    """Tests for Traefik HTTP session reuse."""
+
+    def test_get_routes_reuses_session_and_passes_auth_per_request(self) -> None:
+        """Test one pooled session serves every call with per-instance credentials."""
+        provider = TraefikProxyProvider()
+        secured = ProxyInstance(
+            name="secured",
+            url="http://traefik:8080",
+            target_ip="10.0.0.1",
+            username="admin",
+            password="secret",
+        )
+        anonymous = ProxyInstance(name="open", url="http://traefik2:8080", target_ip="10.0.0.2")
+
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_response.content = b"[]"
+
+        with patch.object(provider._session, "get", return_value=mock_response) as mock_get:
+            provider.get_routes(secured)
+            provider.get_routes(anonymous)
+
+        assert mock_get.call_count == 2
+        first_auth = mock_get.call_args_list[0].kwargs["auth"]
+        assert (first_auth.username, first_auth.password) == ("admin", "secret")
+        assert mock_get.call_args_list[1].kwargs["auth"] is None
+
+
+class TestTraefikRouteCache:
+    """Tests for reusing routes when the Traefik router list is unchanged."""
+
+    def _response(self, routers: list, status_code: int = 200, etag=None) -> MagicMock:
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.status_code = status_code
+        response.content = json.dumps(routers).encode()
+        response.headers = {"ETag": etag} if etag else {}
+        return response
+
+    def test_get_routes_skips_parsing_for_unchanged_body(self) -> None:
+        """Test an identical response body returns the cached routes without parsing."""
+        provider = TraefikProxyProvider()
+        instance = ProxyInstance(name="test", url="http://traefik:8080", target_ip="10.0.0.1")
+        response = self._response([{"name": "app@docker", "rule": "Host(`app.example.com`)"}])
+
+        with patch.object(provider._session, "get", return_value=response):
+            first = provider.get_routes(instance)
+            with patch("external_dns.cli._json_loads") as mock_loads:
+                second = provider.get_routes(instance)
+
+        mock_loads.assert_not_called()
+        assert second == first
+        assert second is not first
+
+    def test_get_routes_sends_etag_and_reuses_routes_on_304(self) -> None:
+        """Test the stored ETag is sent back and a 304 returns the cached routes."""
+        provider = TraefikProxyProvider()
+        instance = ProxyInstance(name="test", url="http://traefik:8080", target_ip="10.0.0.1")
+        routers = [{"name": "app@docker", "rule": "Host(`app.example.com`)"}]
+        responses = [self._response(routers, etag='"v1"'), self._response([], status_code=304)]
+
+        with patch.object(provider._session, "get", side_effect=responses) as mock_get:
+            first = provider.get_routes(instance)
+            second = provider.get_routes(instance)
+
+        assert mock_get.call_args_list[0].kwargs["headers"] is None
+        assert mock_get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert [r.hostname for r in second] == ["app.example.com"]
+        assert second == first
+
+    def test_get_instances_evicts_cached_routes_for_removed_instances(self) -> None:
+        """Test routes cached for an instance are dropped once it leaves the config."""
+        provider = TraefikProxyProvider(
+            instances_json=json.dumps(
+                [
+                    {"name": "core", "url": "http://core:8080", "target_ip": "10.0.0.1"},
+                    {"name": "edge", "url": "http://edge:8080", "target_ip": "10.0.0.2"},
+                ]
+            )
+        )
+        routers = [{"name": "app@docker", "rule": "Host(`app.example.com`)"}]
+        with patch.object(provider._session, "get", return_value=self._response(routers)):
+            for instance in provider.get_instances():
+                provider.get_routes(instance)
+        assert provider._route_cache.keys() == {"core", "edge"}
+
+        provider._instances_json = json.dumps(
+            [{"name": "core", "url": "http://core:8080", "target_ip": "10.0.0.1"}]
+        )
+        provider.get_instances()
+
+        assert provider._route_cache.keys() == {"core"}
+
+    def test_get_routes_ignores_cache_when_instance_changes(self) -> None:
+        """Test a reconfigured instance with the same name re-parses the response."""
+        provider = TraefikProxyProvider()
+        routers = [{"name": "app@docker", "rule": "Host(`app.example.com`)"}]
+        before = ProxyInstance(name="test", url="http://traefik:8080", target_ip="10.0.0.1")
+        after = ProxyInstance(name="test", url="http://traefik:8080", target_ip="10.0.0.2")
+
+        with patch.object(provider._session, "get", return_value=self._response(routers)):
+            provider.get_routes(before)
+            routes = provider.get_routes(after)
+
+        assert [r.target_ip for r in routes] == ["10.0.0.2"]
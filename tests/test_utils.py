@@ -4,9 +4,12 @@ Tests cover:
 - Retry with exponential backoff (retry_with_backoff)
 - Static rewrite parsing (_parse_static_rewrites)
 - Exclude pattern parsing (_parse_exclude_patterns)
-- Domain exclusion checking (_is_domain_excluded)
+- Domain exclusion checking (_is_domain_excluded, _compile_exclude_matcher)
 - Boolean parsing (_parse_bool)
+- Config string coercion (_str_value)
 - Config file finding (find_config_files)
+- YAML config caching (_load_yaml_cached)
+- Runtime settings loading (load_settings_from_yaml)
 """
 
 import os
@@ -19,11 +22,16 @@ import pytest
 import requests
 
 from external_dns.cli import (
+    _compile_exclude_matcher,
     _is_domain_excluded,
+    _literal_exclude,
+    _load_yaml_cached,
     _parse_bool,
     _parse_exclude_patterns,
     _parse_static_rewrites,
+    _str_value,
     find_config_files,
+    load_settings_from_yaml,
     retry_with_backoff,
 )
 
@@ -58,7 +66,7 @@ def test_retry_with_backoff_succeeds_after_retry() -> None:
             raise requests.exceptions.ConnectionError("Connection refused")
         return "success"
 
-    with patch("external_dns.cli.time.sleep"):  # Skip actual sleep
+    with patch("external_dns.cli._shutdown_event.wait", return_value=False):  # Skip actual sleep
         result = retry_with_backoff(flaky_func, max_retries=3, base_delay=0.1)
 
     assert result == "success"
@@ -76,7 +84,7 @@ def test_retry_with_backoff_exhausts_retries() -> None:
 
     import pytest
 
-    with patch("external_dns.cli.time.sleep"):  # Skip actual sleep
+    with patch("external_dns.cli._shutdown_event.wait", return_value=False):  # Skip actual sleep
         with pytest.raises(requests.exceptions.ConnectionError) as exc_info:
             retry_with_backoff(always_fail, max_retries=2, base_delay=0.1)
 
@@ -99,7 +107,7 @@ def test_retry_with_backoff_respects_max_delay() -> None:
 
     import pytest
 
-    with patch("external_dns.cli.time.sleep", side_effect=track_sleep):
+    with patch("external_dns.cli._shutdown_event.wait", side_effect=track_sleep):
         with pytest.raises(requests.exceptions.ConnectionError):
             retry_with_backoff(
                 always_fail,
@@ -138,6 +146,40 @@ def test_retry_with_backoff_only_retries_specified_exceptions() -> None:
     assert call_count == 1
 
 
+def test_retry_with_backoff_zero_retries_calls_once() -> None:
+    """max_retries=0 calls the function once and propagates its error."""
+    call_count = 0
+
+    def always_fail():
+        nonlocal call_count
+        call_count += 1
+        raise requests.exceptions.ConnectionError("Connection refused")
+
+    with patch("external_dns.cli._shutdown_event.wait", return_value=False) as mock_sleep:
+        with pytest.raises(requests.exceptions.ConnectionError):
+            retry_with_backoff(always_fail, max_retries=0)
+
+    assert call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_retry_with_backoff_stops_when_shutdown_requested() -> None:
+    """A pending shutdown aborts the backoff wait and re-raises the last error."""
+    call_count = 0
+
+    def always_fail():
+        nonlocal call_count
+        call_count += 1
+        raise requests.exceptions.ConnectionError("Connection refused")
+
+    with patch("external_dns.cli._shutdown_event.wait", return_value=True) as mock_wait:
+        with pytest.raises(requests.exceptions.ConnectionError):
+            retry_with_backoff(always_fail, max_retries=5, base_delay=10.0)
+
+    assert call_count == 1
+    mock_wait.assert_called_once_with(10.0)
+
+
 def test_retry_with_backoff_custom_retryable_exceptions() -> None:
     """Custom retryable exceptions are respected."""
     call_count = 0
@@ -149,7 +191,7 @@ def test_retry_with_backoff_custom_retryable_exceptions() -> None:
             raise ValueError("Custom retryable")
         return "success"
 
-    with patch("external_dns.cli.time.sleep"):
+    with patch("external_dns.cli._shutdown_event.wait", return_value=False):
         result = retry_with_backoff(
             raise_custom_error,
             max_retries=2,
@@ -160,6 +202,42 @@ def test_retry_with_backoff_custom_retryable_exceptions() -> None:
     assert call_count == 2
 
 
+def _http_error(status: int) -> requests.exceptions.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.exceptions.HTTPError(f"HTTP {status}", response=response)
+
+
+def test_retry_with_backoff_fails_fast_on_client_errors() -> None:
+    """4xx responses are not retried; retrying cannot fix bad credentials."""
+    call_count = 0
+
+    def unauthorized():
+        nonlocal call_count
+        call_count += 1
+        raise _http_error(401)
+
+    with patch("external_dns.cli._shutdown_event.wait", return_value=False) as mock_wait:
+        with pytest.raises(requests.exceptions.HTTPError):
+            retry_with_backoff(unauthorized, max_retries=3)
+
+    assert call_count == 1
+    mock_wait.assert_not_called()
+
+
+def test_retry_with_backoff_retries_server_errors_and_rate_limits() -> None:
+    """5xx and 429 responses are treated as transient and retried."""
+    errors = [_http_error(503), _http_error(429)]
+
+    def flaky():
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    with patch("external_dns.cli._shutdown_event.wait", return_value=False):
+        assert retry_with_backoff(flaky, max_retries=3) == "ok"
+
+
 # =============================================================================
 # Static Rewrite Parsing Tests
 # =============================================================================
@@ -180,6 +258,18 @@ def test_parse_static_rewrites_domain_equals_true_uses_default_ip() -> None:
     assert _parse_static_rewrites("a.example.com=true", "1.2.3.4") == {"a.example.com": "1.2.3.4"}
 
 
+def test_parse_static_rewrites_boolean_answers_use_default_ip() -> None:
+    """Answers accepted as true by _parse_bool also select the default IP."""
+    result = _parse_static_rewrites("a.example.com=YES,b.example.com=on", "1.2.3.4")
+    assert result == {"a.example.com": "1.2.3.4", "b.example.com": "1.2.3.4"}
+
+
+def test_parse_static_rewrites_without_default_ip_skips_bare_domains() -> None:
+    """Bare domains are dropped when there is no default IP to fall back to."""
+    result = _parse_static_rewrites("a.example.com,b.example.com=10.0.0.2", "")
+    assert result == {"b.example.com": "10.0.0.2"}
+
+
 def test_parse_static_rewrites_domain_equals_ip() -> None:
     """Domain with '=IP' uses that specific IP."""
     assert _parse_static_rewrites("a.example.com=10.0.0.10", "1.2.3.4") == {
@@ -247,6 +337,18 @@ def test_parse_exclude_patterns_exact_wildcard_and_regex() -> None:
     assert not _is_domain_excluded("public.example.com", patterns)
 
 
+def test_parse_exclude_patterns_wildcard_character_class() -> None:
+    """fnmatch character classes are honored instead of matched literally."""
+    patterns = _parse_exclude_patterns("node[0-9].lan,*.Home?")
+    assert _is_domain_excluded("NODE7.lan", patterns)
+    assert not _is_domain_excluded("nodex.lan", patterns)
+    assert not _is_domain_excluded("xnode7.lan", patterns)
+    assert _is_domain_excluded("nas.homes", patterns)
+    matcher = _compile_exclude_matcher(patterns)
+    assert matcher("node3.LAN")
+    assert not matcher("xnode7.lan")
+
+
 def test_parse_exclude_patterns_empty_string() -> None:
     """Empty input returns empty list."""
     patterns = _parse_exclude_patterns("")
@@ -278,6 +380,16 @@ def test_parse_exclude_patterns_whitespace_trimmed() -> None:
     assert _is_domain_excluded("foo.test.bar", patterns)
 
 
+def test_parse_exclude_patterns_reuses_compiled_patterns() -> None:
+    """Repeated parses of the same exclusion list reuse the compiled patterns."""
+    first = _parse_exclude_patterns("a.example.com,*.test.*")
+    second = _parse_exclude_patterns(["a.example.com", "*.test.*"])
+    assert first == second
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    # Callers get their own list so mutation cannot leak into the cache
+    assert first is not second
+
+
 # =============================================================================
 # Domain Exclusion Tests
 # =============================================================================
@@ -308,6 +420,78 @@ def test_is_domain_excluded_partial_match() -> None:
     assert not _is_domain_excluded("example.com.other", patterns)
 
 
+def test_compile_exclude_matcher_matches_like_individual_patterns() -> None:
+    """Combined matcher gives the same answers as checking each pattern."""
+    patterns = _parse_exclude_patterns("auth.example.com,*.internal.*,~^dev-\\d+\\.example\\.com$")
+    is_excluded = _compile_exclude_matcher(patterns)
+
+    for domain in [
+        "auth.example.com",
+        "AUTH.example.com",
+        "service.internal.example.com",
+        "dev-42.example.com",
+        "public.example.com",
+        "sub.auth.example.com",
+    ]:
+        assert is_excluded(domain) == _is_domain_excluded(domain, patterns), domain
+
+
+def test_compile_exclude_matcher_empty_patterns() -> None:
+    """No patterns means nothing is excluded."""
+    assert _compile_exclude_matcher([])("anything.example.com") is False
+
+
+def test_compile_exclude_matcher_falls_back_for_backreferences() -> None:
+    """Patterns with backreferences are still matched correctly."""
+    patterns = _parse_exclude_patterns(r"auth.example.com,~^(\w+)-\1\.example\.com$")
+    is_excluded = _compile_exclude_matcher(patterns)
+
+    assert is_excluded("auth.example.com")
+    assert is_excluded("foo-foo.example.com")
+    assert not is_excluded("foo-bar.example.com")
+
+
+def test_compile_exclude_matcher_respects_per_pattern_flags() -> None:
+    """Case-sensitive patterns are not made case-insensitive by combining."""
+    patterns = [re.compile(r"^auth\.example\.com$"), re.compile(r"^dev\.", re.IGNORECASE)]
+    is_excluded = _compile_exclude_matcher(patterns)
+
+    assert is_excluded("auth.example.com")
+    assert not is_excluded("AUTH.example.com")
+    assert is_excluded("DEV.example.com")
+
+
+def test_literal_exclude_recognizes_exact_suffix_and_prefix_patterns() -> None:
+    """Exact, leading- and trailing-wildcard patterns skip the regex engine."""
+    exact, suffix, prefix, both, regex = _parse_exclude_patterns(
+        "Auth.Example.com,*.lan,Dev-*,*mid*,~^dev-\\d+$"
+    )
+    assert _literal_exclude(exact) == ("exact", "auth.example.com")
+    assert _literal_exclude(suffix) == ("suffix", ".lan")
+    assert _literal_exclude(prefix) == ("prefix", "dev-")
+    assert _literal_exclude(both) is None
+    assert _literal_exclude(regex) is None
+
+
+def test_compile_exclude_matcher_mixes_literals_and_regex() -> None:
+    """Literal fast paths and regex fallback agree with per-pattern matching."""
+    patterns = _parse_exclude_patterns(
+        "auth.example.com,*.lan,staging-*,~^dev-\\d+\\.example\\.com$"
+    )
+    is_excluded = _compile_exclude_matcher(patterns)
+
+    for domain in [
+        "AUTH.example.com",
+        "nas.LAN",
+        "Staging-api.example.com",
+        "dev-7.example.com",
+        "lan",
+        "staging",
+        "dev-x.example.com",
+    ]:
+        assert is_excluded(domain) == _is_domain_excluded(domain, patterns), domain
+
+
 # =============================================================================
 # Boolean Parsing Tests
 # =============================================================================
@@ -352,6 +536,30 @@ def test_parse_bool_whitespace_stripped() -> None:
     assert _parse_bool("  yes  ") is True
 
 
+# =============================================================================
+# Config String Coercion Tests
+# =============================================================================
+
+
+def test_str_value_strips_strings() -> None:
+    """String values are stripped."""
+    assert _str_value("  http://traefik:8080  ") == "http://traefik:8080"
+
+
+def test_str_value_unset_uses_default() -> None:
+    """None, empty and other falsy values fall back to the default."""
+    assert _str_value(None) == ""
+    assert _str_value("") == ""
+    assert _str_value(None, "traefik") == "traefik"
+    assert _str_value(0, "traefik") == "traefik"
+
+
+def test_str_value_coerces_non_strings() -> None:
+    """Non-string YAML scalars are converted to strings."""
+    assert _str_value(8080) == "8080"
+    assert _str_value(True) == "True"
+
+
 # =============================================================================
 # Config File Finding Tests
 # =============================================================================
@@ -437,6 +645,127 @@ def test_find_config_files_sorted_alphabetically() -> None:
         assert filenames == ["a_config.yaml", "m_config.yaml", "z_config.yaml"]
 
 
+# =============================================================================
+# YAML Config Cache Tests
+# =============================================================================
+
+
+def test_load_yaml_cached_reuses_parse_while_mtime_unchanged(tmp_path: Path) -> None:
+    """Unchanged files are parsed once and the cached object is returned."""
+    config = tmp_path / "config.yaml"
+    config.write_text("settings:\n  poll_interval: 30\n")
+
+    first = _load_yaml_cached(str(config))
+    second = _load_yaml_cached(str(config))
+
+    assert first == {"settings": {"poll_interval": 30}}
+    assert second is first
+
+
+def test_load_yaml_cached_reparses_after_modification(tmp_path: Path) -> None:
+    """A changed mtime invalidates the cached parse."""
+    config = tmp_path / "config.yaml"
+    config.write_text("settings:\n  poll_interval: 30\n")
+    _load_yaml_cached(str(config))
+
+    config.write_text("settings:\n  poll_interval: 90\n")
+    stat = config.stat()
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert _load_yaml_cached(str(config)) == {"settings": {"poll_interval": 90}}
+
+
+def test_load_yaml_cached_reparses_when_size_changes_within_mtime(tmp_path: Path) -> None:
+    """A size change invalidates the cache even if the mtime is unchanged."""
+    config = tmp_path / "config.yaml"
+    config.write_text("settings:\n  poll_interval: 30\n")
+    stat = config.stat()
+    _load_yaml_cached(str(config))
+
+    config.write_text("settings:\n  poll_interval: 300\n")
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert _load_yaml_cached(str(config)) == {"settings": {"poll_interval": 300}}
+
+
+def test_load_yaml_cached_decodes_utf8(tmp_path: Path) -> None:
+    """Non-ASCII content is decoded correctly from the binary stream."""
+    config = tmp_path / "config.yaml"
+    config.write_text("sources:\n  - name: café\n", encoding="utf-8")
+
+    assert _load_yaml_cached(str(config)) == {"sources": [{"name": "café"}]}
+
+
+def test_load_yaml_cached_raises_for_missing_file(tmp_path: Path) -> None:
+    """Missing files raise OSError so callers can skip them."""
+    with pytest.raises(OSError):
+        _load_yaml_cached(str(tmp_path / "missing.yaml"))
+
+
+# =============================================================================
+# Runtime Settings Loading Tests
+# =============================================================================
+
+
+def test_load_settings_resync_interval(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """resync_interval defaults to 300, reads YAML settings and is overridden by env."""
+    config = tmp_path / "config.yaml"
+    config.write_text("settings:\n  resync_interval: 120\n")
+    monkeypatch.delenv("RESYNC_INTERVAL_SECONDS", raising=False)
+
+    assert load_settings_from_yaml(str(tmp_path / "missing.yaml")).resync_interval == 300
+    assert load_settings_from_yaml(str(config)).resync_interval == 120
+
+    monkeypatch.setenv("RESYNC_INTERVAL_SECONDS", "0")
+    assert load_settings_from_yaml(str(config)).resync_interval == 0
+
+
+def test_load_settings_env_overrides_yaml(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Env vars override YAML settings and merge into exclusions/static rewrites."""
+    config = tmp_path / "config.yaml"
+    config.write_text(
+        "settings:\n"
+        "  sync_mode: once\n"
+        "  poll_interval: 30\n"
+        "exclude_domains:\n"
+        "  - a.example.com\n"
+        "static_rewrites:\n"
+        "  s.example.com: 10.0.0.1\n"
+    )
+    monkeypatch.setenv("SYNC_MODE", " Watch ")
+    monkeypatch.setenv("POLL_INTERVAL_SECONDS", "15")
+    monkeypatch.setenv("LOG_LEVEL", "debug")
+    monkeypatch.delenv("EXTERNAL_DNS_DEFAULT_ZONE", raising=False)
+    monkeypatch.setenv("EXTERNAL_DNS_EXCLUDE_DOMAINS", "a.example.com, b.example.com")
+    monkeypatch.setenv("EXTERNAL_DNS_STATIC_REWRITES", "s.example.com=10.0.0.2,t.example.com")
+
+    settings = load_settings_from_yaml(str(config))
+
+    assert settings.sync_mode == "watch"
+    assert settings.poll_interval == 15
+    assert settings.log_level == "DEBUG"
+    assert settings.default_zone == "internal"
+    assert settings.exclude_domains == ["a.example.com", "b.example.com"]
+    assert settings.static_rewrites == {"s.example.com": "10.0.0.2", "t.example.com": ""}
+
+
+def test_load_settings_compiles_exclude_patterns(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Exclusions from YAML and env are compiled once at load time."""
+    config = tmp_path / "config.yaml"
+    config.write_text("exclude_domains:\n  - '*.internal.*'\n")
+    monkeypatch.setenv("EXTERNAL_DNS_EXCLUDE_DOMAINS", "~^dev-\\d+\\.example\\.com$")
+
+    settings = load_settings_from_yaml(str(config))
+
+    assert len(settings.exclude_patterns) == 2
+    assert all(isinstance(p, re.Pattern) for p in settings.exclude_patterns)
+    assert _is_domain_excluded("svc.internal.example.com", settings.exclude_patterns)
+    assert _is_domain_excluded("dev-7.example.com", settings.exclude_patterns)
+    assert not _is_domain_excluded("app.example.com", settings.exclude_patterns)
+
+
 # =============================================================================
 # Provider Factory Error Message Tests
 # =============================================================================